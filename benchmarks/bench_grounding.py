@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import itertools, multiprocessing, os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pddl_parser.action import Action, compact
+from pddl_parser.PDDL import PDDL_Parser
+from pddl_parser.grounding import ground
+
+# -----------------------------------------------
+# Replace grounding
+# -----------------------------------------------
+
+def groundify_replace(action, objects, types):
+    # Substitution through Action.replace for every assignment
+    if not action.parameters:
+        yield action
+        return
+    variables = [var for var, _ in action.parameters]
+    for assignment in itertools.product(*action.type_map(objects, types)):
+        yield Action(action.name, assignment,
+                     action.replace(action.positive_preconditions, variables, assignment),
+                     action.replace(action.negative_preconditions, variables, assignment),
+                     action.replace(action.add_effects, variables, assignment),
+                     action.replace(action.del_effects, variables, assignment))
+
+# -----------------------------------------------
+# Throughput
+# -----------------------------------------------
+
+def throughput(groundify, parser, repeat):
+    count = 0
+    start_time = time.time()
+    for _ in range(repeat):
+        for action in parser.actions:
+            for act in groundify(action, parser.objects, parser.types):
+                count += 1
+    return count, count / (time.time() - start_time)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    domain = sys.argv[1] if len(sys.argv) > 1 else 'examples/dwr/dwr.pddl'
+    problem = sys.argv[2] if len(sys.argv) > 2 else 'examples/dwr/pb1.pddl'
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    parser = PDDL_Parser()
+    parser.parse_domain(domain)
+    parser.parse_problem(problem)
+    for name, groundify in [('replace', groundify_replace), ('template', Action.groundify)]:
+        count, rate = throughput(groundify, parser, repeat)
+        print(name + ': ' + str(count) + ' actions, ' + str(int(rate)) + ' actions/s')
+    # Traced bytes kept by the list of ground actions, when tracemalloc is available
+    try:
+        import tracemalloc
+    except ImportError:
+        tracemalloc = None
+    for name, convert in [('action', list), ('compact', compact)] if tracemalloc else []:
+        tracemalloc.start()
+        ground_actions = convert(ground(parser.actions, parser.state, parser.objects, parser.types, False))
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(name + ': ' + str(size // len(ground_actions)) + ' bytes per action')
+        del ground_actions
+    # Worker processes are started once per grounding
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    for name, compact_workers in [('parallel', False), ('parallel compact', True)]:
+        start_time = time.time()
+        for _ in range(repeat):
+            count = len(ground(parser.actions, parser.state, parser.objects, parser.types, False, workers or multiprocessing.cpu_count(), compact_workers))
+        print(name + ': ' + str(count * repeat) + ' actions, ' + str(int(count * repeat / (time.time() - start_time))) + ' actions/s')
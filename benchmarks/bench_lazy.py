@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import os, shutil, sys, tempfile, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from generators import blocksworld_table
+from pddl_parser.planner import Planner
+
+# -----------------------------------------------
+# Measure
+# -----------------------------------------------
+
+def measure(domain, problem, representation):
+    # Seconds, instantiated actions and peak traced allocation in MB, when tracemalloc is available
+    try:
+        import tracemalloc
+        tracemalloc.start()
+    except ImportError:
+        tracemalloc = None
+    planner = Planner()
+    start_time = time.time()
+    plan = planner.solve(domain, problem, representation=representation)
+    seconds = time.time() - start_time
+    peak = float('nan')
+    if tracemalloc:
+        peak = tracemalloc.get_traced_memory()[1] / 1048576.0
+        tracemalloc.stop()
+    return seconds, planner.statistics.ground_actions, peak, len(plan)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 100, 200]
+    domain = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'blocksworld', 'blocksworld.pddl')
+    directory = tempfile.mkdtemp()
+    try:
+        print('blocks  representation  time(s)  actions  peak(MB)  plan')
+        for blocks in sizes:
+            problem = os.path.join(directory, 'pb' + str(blocks) + '.pddl')
+            with open(problem, 'w') as f:
+                f.write(blocksworld_table(blocks, 2)[1])
+            for representation in ['set', 'lazy']:
+                seconds, actions, peak, length = measure(domain, problem, representation)
+                print('%6d  %14s %8.3f %8d %9.1f %5d' % (blocks, representation, seconds, actions, peak, length))
+            os.remove(problem)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import argparse, multiprocessing, os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pddl_parser.planner import Planner
+
+# -----------------------------------------------
+# Measure
+# -----------------------------------------------
+
+def measure(domain, problem, representation, search, workers=None):
+    planner = Planner()
+    plan = planner.solve(domain, problem, representation=representation, search=search, workers=workers)
+    return planner.statistics.times['search'], planner.statistics.expanded, None if plan is None else len(plan)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    cores = multiprocessing.cpu_count()
+    argparser = argparse.ArgumentParser(description='Speedup of parallel BFS over serial BFS')
+    argparser.add_argument('domain', nargs='?', default='examples/dwr/dwr.pddl')
+    argparser.add_argument('problem', nargs='?', default='examples/dwr/pb1.pddl')
+    argparser.add_argument('-j', type=int, nargs='+', default=[2 ** i for i in range(6) if 2 ** i <= max(cores, 4)], help='worker counts')
+    argparser.add_argument('-r', default='bitset', choices=['set', 'bitset', 'sas'], help='state representation')
+    args = argparser.parse_args()
+    print(str(cores) + ' cores, ' + args.r + ' states')
+    serial_time, expanded, length = measure(args.domain, args.problem, args.r, 'bfs')
+    print('workers  search(s)  speedup  expanded  plan')
+    print('%7s %10.3f %8.2f %9d %5s' % ('serial', serial_time, 1.0, expanded, length))
+    for workers in args.j:
+        seconds, expanded, parallel_length = measure(args.domain, args.problem, args.r, 'pbfs', workers)
+        if parallel_length != length:
+            sys.exit('Plan length ' + str(parallel_length) + ' differs from serial BFS ' + str(length))
+        print('%7d %10.3f %8.2f %9d %5s' % (workers, seconds, serial_time / seconds, expanded, parallel_length))
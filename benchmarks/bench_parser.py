@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import os, re, shutil, sys, tempfile, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pddl_parser.PDDL import PDDL_Parser
+
+# -----------------------------------------------
+# Generate problem
+# -----------------------------------------------
+
+def generate_problem(filename, facts):
+    # TSP problem over a ring of cities, one city and one connected fact each
+    cities = facts
+    with open(filename, 'w') as f:
+        f.write('(define (problem tsp-' + str(facts) + ') (:domain tsp)\n  (:objects')
+        for i in range(cities):
+            f.write(' c' + str(i))
+        f.write(' - position)\n  (:init (at c0)\n')
+        for i in range(facts):
+            f.write('    (connected c' + str(i) + ' c' + str((i + 1) % cities) + ')\n')
+        f.write('  )\n  (:goal (and (at c0) (visited c1))))\n')
+
+# -----------------------------------------------
+# Measure
+# -----------------------------------------------
+
+def measure(domain, problem):
+    parser = PDDL_Parser()
+    start_time = time.time()
+    parser.scan_tokens(problem)
+    tokenize_time = time.time() - start_time
+    start_time = time.time()
+    parser.parse_domain(domain)
+    parser.parse_problem(problem)
+    return tokenize_time, time.time() - start_time
+
+
+def peak_memory(domain, problem):
+    # Peak traced allocation in MB while parsing, when tracemalloc is available
+    try:
+        import tracemalloc
+    except ImportError:
+        return float('nan')
+    parser = PDDL_Parser()
+    parser.parse_domain(domain)
+    tracemalloc.start()
+    parser.parse_problem(problem)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1048576.0
+
+def scan_whole_file(filename):
+    # Baseline of the parser before streaming, the whole file is read and scanned into nested lists
+    with open(filename) as f:
+        text = re.sub(r';.*', '', f.read(), flags=re.MULTILINE).lower()
+    stack = []
+    tokens = []
+    for t in re.findall(r'[()]|[^\s()]+', text):
+        if t == '(':
+            stack.append(tokens)
+            tokens = []
+        elif t == ')':
+            group = tokens
+            tokens = stack.pop()
+            tokens.append(group)
+        else:
+            tokens.append(t)
+    return tokens[0]
+
+def peak_memory_whole_file(problem):
+    # Peak traced allocation in MB while scanning the whole file and making the state from its
+    # init group, when tracemalloc is available
+    try:
+        import tracemalloc
+    except ImportError:
+        return float('nan')
+    tracemalloc.start()
+    tokens = scan_whole_file(problem)
+    state = frozenset([tuple(fact) for group in tokens[1:] if group[0] == ':init' for fact in group[1:]])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1048576.0
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    domain = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'tsp', 'tsp.pddl')
+    directory = tempfile.mkdtemp()
+    try:
+        print('facts       bytes  tokenize(s)  parse(s)  us/fact  peak(MB)  whole file peak(MB)')
+        for facts in sizes:
+            problem = os.path.join(directory, 'pb' + str(facts) + '.pddl')
+            generate_problem(problem, facts)
+            tokenize_time, parse_time = measure(domain, problem)
+            memory = peak_memory(domain, problem)
+            whole_file_memory = peak_memory_whole_file(problem)
+            print('%7d %11d %12.3f %9.3f %8.2f %9.1f %20.1f' % (facts, os.path.getsize(problem), tokenize_time, parse_time, 1e6 * parse_time / facts, memory, whole_file_memory))
+            os.remove(problem)
+    finally:
+        shutil.rmtree(directory)
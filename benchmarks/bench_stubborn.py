@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+import os, shutil, sys, tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from generators import GENERATORS
+from pddl_parser.planner import Planner
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+# -----------------------------------------------
+# Measure
+# -----------------------------------------------
+
+def measure(domain, problem, stubborn, search, heuristic):
+    planner = Planner()
+    plan = planner.solve(domain, problem, search=search, heuristic=heuristic, stubborn=stubborn)
+    statistics = planner.statistics
+    return statistics.times['search'], statistics.expanded, statistics.generated, planner.stubborn_pruned, len(plan)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse
+    argparser = argparse.ArgumentParser(description='Compare search with and without strong stubborn sets')
+    argparser.add_argument('domains', nargs='*', default=['dinner', 'tsp', 'dwr'], help=', '.join(sorted(GENERATORS)))
+    argparser.add_argument('-n', type=int, nargs='+', default=[2, 3, 4, 5], help='problem sizes')
+    argparser.add_argument('-s', default='bfs', help='search algorithm')
+    argparser.add_argument('-H', default='hmax', help='heuristic')
+    args = argparser.parse_args()
+    directory = tempfile.mkdtemp()
+    try:
+        print('problem        expanded  stubborn  generated  stubborn   pruned  search(s)  stubborn(s)  plan')
+        for name in args.domains:
+            for size in args.n:
+                domain_text, problem_text = GENERATORS[name](size)
+                if domain_text is None:
+                    domain = os.path.join(EXAMPLES, name, name + '.pddl')
+                else:
+                    domain = os.path.join(directory, name + '-domain.pddl')
+                    with open(domain, 'w') as f:
+                        f.write(domain_text)
+                problem = os.path.join(directory, name + '-' + str(size) + '.pddl')
+                with open(problem, 'w') as f:
+                    f.write(problem_text)
+                seconds, expanded, generated, _, length = measure(domain, problem, False, args.s, args.H)
+                stubborn_seconds, stubborn_expanded, stubborn_generated, pruned, stubborn_length = measure(domain, problem, True, args.s, args.H)
+                if stubborn_length != length:
+                    sys.exit('Plan length differs with stubborn sets')
+                print('%-14s %8d %9d %10d %9d %8d %10.3f %12.3f %5d' % (name + ' ' + str(size), expanded, stubborn_expanded, generated, stubborn_generated,
+                      pruned, seconds, stubborn_seconds, length))
+    finally:
+        shutil.rmtree(directory)
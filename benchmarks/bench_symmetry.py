@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+import os, shutil, sys, tempfile, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from generators import blocksworld_table, tsp_complete
+from pddl_parser.planner import Planner
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+# -----------------------------------------------
+# Measure
+# -----------------------------------------------
+
+def measure(domain, problem, symmetry):
+    planner = Planner()
+    start_time = time.time()
+    plan = planner.solve(domain, problem, symmetry=symmetry)
+    return time.time() - start_time, planner.statistics.expanded, len(plan), len(planner.object_classes)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [6, 8, 10]
+    directory = tempfile.mkdtemp()
+    try:
+        print('problem               classes  expanded  symmetric  reduction  time(s)  symmetric(s)  plan')
+        for name, generate in [('blocksworld', blocksworld_table), ('tsp', tsp_complete)]:
+            domain = os.path.join(EXAMPLES, name, name + '.pddl')
+            for size in sizes:
+                problem = os.path.join(directory, generate.__name__ + str(size) + '.pddl')
+                with open(problem, 'w') as f:
+                    f.write(generate(size)[1])
+                seconds, expanded, length, _ = measure(domain, problem, False)
+                symmetric_seconds, symmetric_expanded, symmetric_length, classes = measure(domain, problem, True)
+                if symmetric_length != length:
+                    sys.exit('Plan length differs with symmetry pruning')
+                print('%-21s %7d %9d %10d %9.1f%% %8.3f %13.3f %5d' % (generate.__name__ + ' ' + str(size), classes, expanded, symmetric_expanded,
+                      100.0 * (expanded - symmetric_expanded) / expanded, seconds, symmetric_seconds, length))
+                os.remove(problem)
+    finally:
+        shutil.rmtree(directory)
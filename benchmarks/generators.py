@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+import random
+
+# Each generator returns the domain text, or None to use the bundled domain, and the problem text
+
+# -----------------------------------------------
+# Blocksworld
+# -----------------------------------------------
+
+def blocksworld(blocks, seed=0):
+    # Random initial towers, goal is a single random tower
+    rng = random.Random(seed)
+    names = ['b' + str(i) for i in range(blocks)]
+    init = []
+    shuffled = list(names)
+    rng.shuffle(shuffled)
+    towers = []
+    for name in shuffled:
+        if towers and rng.random() < 0.5:
+            towers[rng.randrange(len(towers))].append(name)
+        else:
+            towers.append([name])
+    for tower in towers:
+        init.append('(onTable ' + tower[0] + ')')
+        for below, above in zip(tower, tower[1:]):
+            init.append('(on ' + above + ' ' + below + ')')
+        init.append('(clear ' + tower[-1] + ')')
+    init += ['(equal ' + name + ' ' + name + ')' for name in names]
+    goal = list(names)
+    rng.shuffle(goal)
+    goals = ['(on ' + above + ' ' + below + ')' for below, above in zip(goal, goal[1:])]
+    return None, problem('blocksworld', 'blocksworld-' + str(blocks), ' '.join(names), init, goals)
+
+def blocksworld_table(blocks, tower=3):
+    # Every block on the table and a tower of the first blocks as goal, the other blocks are interchangeable
+    names = ['b' + str(i) for i in range(blocks)]
+    init = ['(clear ' + name + ') (ontable ' + name + ')' for name in names]
+    goals = ['(on ' + above + ' ' + below + ')' for above, below in zip(names, names[1:tower])]
+    return None, problem('blocksworld', 'table-' + str(blocks), ' '.join(names), init, goals)
+
+# -----------------------------------------------
+# TSP
+# -----------------------------------------------
+
+def tsp(cities, seed=0):
+    # Ring of cities with random chords, visit all and return to the start
+    rng = random.Random(seed)
+    names = ['c' + str(i) for i in range(cities)]
+    edges = set()
+    for i in range(cities):
+        edges.add((i, (i + 1) % cities))
+        edges.add(((i + 1) % cities, i))
+    for _ in range(cities):
+        a, b = rng.randrange(cities), rng.randrange(cities)
+        if a != b:
+            edges.add((a, b))
+    init = ['(connected ' + names[a] + ' ' + names[b] + ')' for a, b in sorted(edges)]
+    init.append('(at c0)')
+    goals = ['(at c0)'] + ['(visited ' + name + ')' for name in names]
+    return None, problem('tsp', 'tsp-' + str(cities), ' '.join(names) + ' - position', init, goals)
+
+def tsp_complete(cities):
+    # Every pair of cities connected, cities other than the start are interchangeable
+    names = ['c' + str(i) for i in range(cities)]
+    init = ['(connected ' + a + ' ' + b + ')' for a in names for b in names if a != b]
+    init.append('(at c0)')
+    goals = ['(at c0)'] + ['(visited ' + name + ')' for name in names]
+    return None, problem('tsp', 'complete-' + str(cities), ' '.join(names) + ' - position', init, goals)
+
+# -----------------------------------------------
+# DWR
+# -----------------------------------------------
+
+def dwr(containers, seed=0):
+    # Containers start spread over two piles in l1 and must reach the piles in l2
+    rng = random.Random(seed)
+    names = ['c' + str(i) for i in range(containers)]
+    init = ['(adjacent l1 l2)', '(adjacent l2 l1)',
+            '(attached p1 l1)', '(attached q1 l1)', '(attached p2 l2)', '(attached q2 l2)',
+            '(belong k1 l1)', '(belong k2 l2)',
+            '(at r1 l1)', '(unloaded r1)', '(occupied l1)', '(empty k1)', '(empty k2)',
+            '(top pallet p2)', '(top pallet q2)']
+    goals = []
+    piles = {'p1': [], 'q1': []}
+    for name in names:
+        piles[rng.choice(['p1', 'q1'])].append(name)
+        goals.append('(in ' + name + ' ' + rng.choice(['p2', 'q2']) + ')')
+    for pile, stack in sorted(piles.items()):
+        below = 'pallet'
+        for name in stack:
+            init.append('(in ' + name + ' ' + pile + ')')
+            init.append('(on ' + name + ' ' + below + ')')
+            below = name
+        init.append('(top ' + below + ' ' + pile + ')')
+    init += ['(equal ' + name + ' ' + name + ')' for name in names + ['pallet']]
+    objects = 'r1 - robot l1 l2 - location k1 k2 - crane p1 q1 p2 q2 - pile ' + ' '.join(names) + ' pallet - container'
+    return None, problem('dwr', 'dwr-' + str(containers), objects, init, goals)
+
+# -----------------------------------------------
+# Dinner
+# -----------------------------------------------
+
+def dinner(copies, seed=0):
+    # Independent copies of the propositional dinner domain
+    predicates = []
+    actions = []
+    init = []
+    goals = []
+    for i in range(copies):
+        clean, dinner, quiet, present, garbage = ['(' + p + str(i) + ')' for p in ['clean', 'dinner', 'quiet', 'present', 'garbage']]
+        predicates += [clean, dinner, quiet, present, garbage]
+        actions += ['(:action cook' + str(i) + ' :precondition ' + clean + ' :effect ' + dinner + ')',
+                    '(:action wrap' + str(i) + ' :precondition ' + quiet + ' :effect ' + present + ')',
+                    '(:action carry' + str(i) + ' :precondition ' + garbage + ' :effect (and (not ' + garbage + ') (not ' + clean + ')))',
+                    '(:action dolly' + str(i) + ' :precondition ' + garbage + ' :effect (and (not ' + garbage + ') (not ' + quiet + ')))']
+        init += [garbage, clean, quiet]
+        goals += [dinner, present, '(not ' + garbage + ')']
+    domain = '(define (domain dinner)\n  (:requirements :strips)\n  (:predicates ' + ' '.join(predicates) + ')\n  ' + '\n  '.join(actions) + '\n)\n'
+    return domain, problem('dinner', 'dinner-' + str(copies), '', init, goals)
+
+# -----------------------------------------------
+# Problem
+# -----------------------------------------------
+
+def problem(domain, name, objects, init, goals):
+    return '(define (problem ' + name + ') (:domain ' + domain + ')\n' + \
+           '  (:objects ' + objects + ')\n' + \
+           '  (:init\n    ' + '\n    '.join(init) + '\n  )\n' + \
+           '  (:goal (and\n    ' + '\n    '.join(goals) + '\n  ))\n)\n'
+
+
+GENERATORS = {'blocksworld': blocksworld, 'tsp': tsp, 'dwr': dwr, 'dinner': dinner}
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+import json, os, platform, shutil, sys, tempfile, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from generators import GENERATORS
+from pddl_parser.planner import Planner
+from pddl_parser.statistics import Statistics
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+SIZES = {
+    'blocksworld': [4, 6, 8, 10],
+    'tsp': [4, 8, 12, 16],
+    'dwr': [2, 3, 4, 5],
+    'dinner': [1, 2, 4, 8]
+}
+
+# -----------------------------------------------
+# Run
+# -----------------------------------------------
+
+def run(domains, sizes, repeat=3, directory=None, **options):
+    # Best of repeat runs per phase for each generated problem
+    results = []
+    # Generated problems are only removed from a directory created here
+    created = directory is None
+    if created:
+        directory = tempfile.mkdtemp()
+    try:
+        for name in domains:
+            for size in sizes.get(name, SIZES[name]):
+                domain_text, problem_text = GENERATORS[name](size)
+                if domain_text is None:
+                    domain = os.path.join(EXAMPLES, name, name + '.pddl')
+                else:
+                    domain = os.path.join(directory, name + '-' + str(size) + '-domain.pddl')
+                    with open(domain, 'w') as f:
+                        f.write(domain_text)
+                problem = os.path.join(directory, name + '-' + str(size) + '.pddl')
+                with open(problem, 'w') as f:
+                    f.write(problem_text)
+                best = None
+                for _ in range(repeat):
+                    statistics = Statistics()
+                    plan = Planner().solve(domain, problem, statistics=statistics, **options)
+                    if best is None:
+                        best = statistics
+                    else:
+                        for phase in statistics.times:
+                            best.times[phase] = min(best.times[phase], statistics.times[phase])
+                search_time = best.times['search']
+                results.append({
+                    'domain': name,
+                    'size': size,
+                    'bytes': os.path.getsize(problem),
+                    'times': best.times,
+                    'ground_actions': best.ground_actions,
+                    'expanded': best.expanded,
+                    'generated': best.generated,
+                    'plan_length': None if plan is None else len(plan),
+                    'parse_rate': os.path.getsize(problem) / max(best.times['tokenize'] + best.times['parse'], 1e-9),
+                    'ground_rate': best.ground_actions / max(best.times['ground'], 1e-9),
+                    'search_rate': best.generated / max(search_time, 1e-9)
+                })
+                print_result(results[-1])
+    finally:
+        if created:
+            shutil.rmtree(directory)
+    return results
+
+def print_result(result):
+    times = result['times']
+    print('%-12s %5d %10.4f %10.4f %10.4f %10.4f %8d %8d %6s' % (
+        result['domain'], result['size'], times['tokenize'], times['parse'], times['ground'], times['search'],
+        result['ground_actions'], result['expanded'], result['plan_length']))
+
+# -----------------------------------------------
+# Compare
+# -----------------------------------------------
+
+RATES = {'parse_rate': ['tokenize', 'parse'], 'ground_rate': ['ground'], 'search_rate': ['search']}
+
+def compare(results, baseline, tolerance=0.2, min_time=0.01):
+    # Regressions are rates below (1 - tolerance) of the baseline rate for the same domain and size,
+    # phases faster than min_time in the baseline are too noisy to compare
+    previous = dict(((r['domain'], r['size']), r) for r in baseline['results'])
+    regressions = []
+    for result in results:
+        old = previous.get((result['domain'], result['size']))
+        if old:
+            for rate, phases in sorted(RATES.items()):
+                if sum([old['times'][phase] for phase in phases]) < min_time:
+                    continue
+                if result[rate] < (1 - tolerance) * old[rate]:
+                    regressions.append((result['domain'], result['size'], rate, old[rate], result[rate]))
+    return regressions
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse
+    argparser = argparse.ArgumentParser(description='Benchmark tokenize, parse, ground and search phases over generated problems')
+    argparser.add_argument('domains', nargs='*', default=sorted(GENERATORS), help='domains to benchmark')
+    argparser.add_argument('-n', type=int, nargs='+', help='problem sizes')
+    argparser.add_argument('-r', type=int, default=3, help='repetitions, best time is kept')
+    argparser.add_argument('-s', default='gbfs', help='search algorithm')
+    argparser.add_argument('-H', default='hff', help='heuristic')
+    argparser.add_argument('-o', metavar='FILE', help='write results as JSON')
+    argparser.add_argument('-b', metavar='FILE', help='baseline JSON to compare against')
+    argparser.add_argument('-t', type=float, default=0.2, help='tolerated throughput drop')
+    argparser.add_argument('-m', type=float, default=0.01, help='minimum baseline phase time in seconds to compare')
+    args = argparser.parse_args()
+    sizes = dict((name, args.n) for name in args.domains) if args.n else {}
+    print('%-12s %5s %10s %10s %10s %10s %8s %8s %6s' % ('domain', 'size', 'tokenize', 'parse', 'ground', 'search', 'actions', 'expanded', 'plan'))
+    results = run(args.domains, sizes, args.r, search=args.s, heuristic=args.H)
+    output = {'time': time.time(), 'python': platform.python_version(), 'search': args.s, 'heuristic': args.H, 'results': results}
+    if args.o:
+        with open(args.o, 'w') as f:
+            json.dump(output, f, indent=1, sort_keys=True)
+    if args.b:
+        with open(args.b) as f:
+            regressions = compare(results, json.load(f), args.t, args.m)
+        for domain, size, rate, old, new in regressions:
+            print('Regression ' + domain + ' ' + str(size) + ' ' + rate + ': ' + str(int(old)) + ' -> ' + str(int(new)))
+        if regressions:
+            sys.exit(1)
@@ -16,26 +16,67 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
-import re
+import itertools, re, time
 from .action import Action
 
+TOKENS = re.compile(r';[^\n]*|[()]|[^\s();]+')
+
 
 class PDDL_Parser:
 
     SUPPORTED_REQUIREMENTS = [':strips', ':negative-preconditions', ':typing']
 
+    tokenize_time = 0.0  # Seconds spent reading and splitting files into tokens
+
     # -----------------------------------------------
     # Tokens
     # -----------------------------------------------
 
-    def scan_tokens(self, filename):
+    def iter_tokens(self, filename, chunk_size=1 << 20):
+        # Tokens and comments never cross lines, chunks are split at the last newline,
+        # repeated tokens share a single string
+        symbols = {}
         with open(filename) as f:
-            # Remove single line comments
-            str = re.sub(r';.*', '', f.read(), flags=re.MULTILINE).lower()
-        # Tokenize
+            rest = ''
+            comment = False
+            while True:
+                start_time = time.time()
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                if comment:
+                    # Skip the rest of a comment longer than a chunk
+                    end = chunk.find('\n')
+                    if end == -1:
+                        continue
+                    chunk = chunk[end:]
+                    comment = False
+                chunk = rest + chunk
+                end = chunk.rfind('\n') + 1
+                if not end:
+                    # Lines longer than a chunk end at a comment or else at the last space or parentheses
+                    end = chunk.find(';')
+                    if end != -1:
+                        comment = True
+                        chunk = chunk[:end]
+                    else:
+                        end = max([chunk.rfind(c) for c in ' \t\r()']) + 1
+                rest = chunk[end:]
+                tokens = TOKENS.findall(chunk[:end].lower())
+                self.tokenize_time += time.time() - start_time
+                for t in tokens:
+                    if t[0] != ';':
+                        yield symbols.setdefault(t, t)
+            tokens = TOKENS.findall(rest.lower())
+            self.tokenize_time += time.time() - start_time
+            for t in tokens:
+                if t[0] != ';':
+                    yield symbols.setdefault(t, t)
+
+    def scan_tokens(self, filename):
         stack = []
         list = []
-        for t in re.findall(r'[()]|[^\s()]+', str):
+        for t in self.iter_tokens(filename):
             if t == '(':
                 stack.append(list)
                 list = []
@@ -54,38 +95,55 @@ class PDDL_Parser:
             raise Exception('Malformed expression')
         return list[0]
 
+    def scan_group(self, tokens):
+        # Read tokens of an already open group up to its close parentheses
+        stack = []
+        list = []
+        for t in tokens:
+            if t == '(':
+                stack.append(list)
+                list = []
+            elif t == ')':
+                if not stack:
+                    return list
+                li = list
+                list = stack.pop()
+                list.append(li)
+            else:
+                list.append(t)
+        raise Exception('Missing close parentheses')
+
     # -----------------------------------------------
     # Parse domain
     # -----------------------------------------------
 
     def parse_domain(self, domain_filename, requirements=SUPPORTED_REQUIREMENTS):
         tokens = self.scan_tokens(domain_filename)
-        if type(tokens) is list and tokens.pop(0) == 'define':
+        if type(tokens) is list and tokens and tokens[0] == 'define':
             self.domain_name = None
             self.requirements = []
             self.types = {}
             self.objects = {}
             self.actions = []
             self.predicates = {}
-            while tokens:
-                group = tokens.pop(0)
-                t = group.pop(0)
+            for group in itertools.islice(tokens, 1, None):
+                t = group[0]
                 if t == 'domain':
-                    self.domain_name = group[0]
+                    self.domain_name = group[1]
                 elif t == ':requirements':
-                    for req in group:
+                    for req in itertools.islice(group, 1, None):
                         if req not in requirements:
                             raise Exception('Requirement ' + req + ' not supported')
-                    self.requirements = group
+                    self.requirements = group[1:]
                 elif t == ':constants':
-                    self.parse_objects(group, t)
+                    self.parse_objects(group[1:], t)
                 elif t == ':predicates':
-                    self.parse_predicates(group)
+                    self.parse_predicates(group[1:])
                 elif t == ':types':
-                    self.parse_types(group)
+                    self.parse_types(group[1:])
                 elif t == ':action':
-                    self.parse_action(group)
-                else: self.parse_domain_extended(t, group)
+                    self.parse_action(group[1:])
+                else: self.parse_domain_extended(t, group[1:])
         else:
             raise Exception('File ' + domain_filename + ' does not match domain pattern')
 
@@ -98,20 +156,23 @@ class PDDL_Parser:
 
     def parse_hierarchy(self, group, structure, name, redefine):
         list = []
-        while group:
-            if redefine and group[0] in structure:
-                raise Exception('Redefined supertype of ' + group[0])
-            elif group[0] == '-':
+        i = 0
+        while i < len(group):
+            t = group[i]
+            if redefine and t in structure:
+                raise Exception('Redefined supertype of ' + t)
+            elif t == '-':
                 if not list:
                     raise Exception('Unexpected hyphen in ' + name)
-                group.pop(0)
-                type = group.pop(0)
+                type = group[i + 1]
                 if type not in structure:
                     structure[type] = []
                 structure[type] += list
                 list = []
+                i += 2
             else:
-                list.append(group.pop(0))
+                list.append(t)
+                i += 1
         if list:
             if 'object' not in structure:
                 structure['object'] = []
@@ -137,23 +198,27 @@ class PDDL_Parser:
 
     def parse_predicates(self, group):
         for pred in group:
-            predicate_name = pred.pop(0)
+            predicate_name = pred[0]
             if predicate_name in self.predicates:
                 raise Exception('Predicate ' + predicate_name + ' redefined')
             arguments = {}
             untyped_variables = []
-            while pred:
-                t = pred.pop(0)
+            i = 1
+            while i < len(pred):
+                t = pred[i]
                 if t == '-':
                     if not untyped_variables:
                         raise Exception('Unexpected hyphen in predicates')
-                    type = pred.pop(0)
-                    while untyped_variables:
-                        arguments[untyped_variables.pop(0)] = type
+                    type = pred[i + 1]
+                    for var in untyped_variables:
+                        arguments[var] = type
+                    untyped_variables = []
+                    i += 2
                 else:
                     untyped_variables.append(t)
-            while untyped_variables:
-                arguments[untyped_variables.pop(0)] = 'object'
+                    i += 1
+            for var in untyped_variables:
+                arguments[var] = 'object'
             self.predicates[predicate_name] = arguments
 
     # -----------------------------------------------
@@ -161,7 +226,7 @@ class PDDL_Parser:
     # -----------------------------------------------
 
     def parse_action(self, group):
-        name = group.pop(0)
+        name = group[0] if group else None
         if type(name) is not str:
             raise Exception('Action without name definition')
         for act in self.actions:
@@ -173,40 +238,47 @@ class PDDL_Parser:
         add_effects = []
         del_effects = []
         extensions = []
-        while group:
-            t = group.pop(0)
+        i = 1
+        while i < len(group):
+            t = group[i]
             if t == ':parameters':
-                if type(group) is not list:
+                if i + 1 == len(group) or type(group[i + 1]) is not list:
                     raise Exception('Error with ' + name + ' parameters')
                 parameters = []
                 untyped_parameters = []
-                p = group.pop(0)
-                while p:
-                    t = p.pop(0)
+                p = group[i + 1]
+                j = 0
+                while j < len(p):
+                    t = p[j]
                     if t == '-':
                         if not untyped_parameters:
                             raise Exception('Unexpected hyphen in ' + name + ' parameters')
-                        ptype = p.pop(0)
-                        while untyped_parameters:
-                            parameters.append([untyped_parameters.pop(0), ptype])
+                        ptype = p[j + 1]
+                        for var in untyped_parameters:
+                            parameters.append([var, ptype])
+                        untyped_parameters = []
+                        j += 2
                     else:
                         untyped_parameters.append(t)
-                while untyped_parameters:
-                    parameters.append([untyped_parameters.pop(0), 'object'])
+                        j += 1
+                for var in untyped_parameters:
+                    parameters.append([var, 'object'])
+                i += 2
             elif t == ':precondition':
-                self.split_predicates(group.pop(0), positive_preconditions, negative_preconditions, name, ' preconditions')
+                self.split_predicates(group[i + 1], positive_preconditions, negative_preconditions, name, ' preconditions')
+                i += 2
             elif t == ':effect':
-                self.split_predicates(group.pop(0), add_effects, del_effects, name, ' effects')
+                self.split_predicates(group[i + 1], add_effects, del_effects, name, ' effects')
+                i += 2
             else:
-                group.insert(0, t)
-                extensions.append(group)
+                extensions.append(t)
+                i += 1
         action = Action(name, parameters, positive_preconditions, negative_preconditions, add_effects, del_effects)
         self.parse_action_extended(action, extensions)
         self.actions.append(action)
 
     def parse_action_extended(self, action, group):
-        while group:
-            t = group.pop(0)
+        for t in group:
             print(str(t) + ' is not recognized in action ' + action.name)
 
     # -----------------------------------------------
@@ -216,15 +288,25 @@ class PDDL_Parser:
     def parse_problem(self, problem_filename):
         def frozenset_of_tuples(data):
             return frozenset([tuple(t) for t in data])
-        tokens = self.scan_tokens(problem_filename)
-        if type(tokens) is list and tokens.pop(0) == 'define':
+        # Groups are read one at a time from the token stream, init facts go straight to the state
+        tokens = self.iter_tokens(problem_filename)
+        if next(tokens, None) == '(' and next(tokens, None) == 'define':
             self.problem_name = None
             self.state = frozenset()
             self.positive_goals = frozenset()
             self.negative_goals = frozenset()
-            while tokens:
-                group = tokens.pop(0)
-                t = group.pop(0)
+            for t in tokens:
+                if t == ')':
+                    if next(tokens, None) is not None:
+                        raise Exception('Malformed expression')
+                    break
+                elif t != '(':
+                    raise Exception('Malformed expression')
+                t = next(tokens, None)
+                if t == ':init':
+                    self.state = frozenset(self.scan_facts(tokens))
+                    continue
+                group = self.scan_group(tokens)
                 if t == 'problem':
                     self.problem_name = group[0]
                 elif t == ':domain':
@@ -234,8 +316,6 @@ class PDDL_Parser:
                     pass  # Ignore requirements in problem, parse them in the domain
                 elif t == ':objects':
                     self.parse_objects(group, t)
-                elif t == ':init':
-                    self.state = frozenset_of_tuples(group)
                 elif t == ':goal':
                     positive_goals = []
                     negative_goals = []
@@ -243,9 +323,27 @@ class PDDL_Parser:
                     self.positive_goals = frozenset_of_tuples(positive_goals)
                     self.negative_goals = frozenset_of_tuples(negative_goals)
                 else: self.parse_problem_extended(t, group)
+            else:
+                raise Exception('Missing close parentheses')
         else:
             raise Exception('File ' + problem_filename + ' does not match problem pattern')
 
+    def scan_facts(self, tokens):
+        for t in tokens:
+            if t == ')':
+                return
+            elif t != '(':
+                raise Exception('Unexpected ' + t + ' in init')
+            fact = []
+            for t in tokens:
+                if t == ')':
+                    break
+                elif t == '(':
+                    raise Exception('Unexpected nested expression in init')
+                fact.append(t)
+            yield tuple(fact)
+        raise Exception('Missing close parentheses')
+
     def parse_problem_extended(self, t, group):
         print(str(t) + ' is not recognized in problem')
 
@@ -258,7 +356,7 @@ class PDDL_Parser:
             raise Exception('Error with ' + name + part)
         if group:
             if group[0] == 'and':
-                group.pop(0)
+                group = itertools.islice(group, 1, None)
             else:
                 group = [group]
             for predicate in group:
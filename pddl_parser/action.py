@@ -17,9 +17,16 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
 import itertools
+from operator import itemgetter
+try:
+    from sys import intern
+except ImportError:
+    pass  # Python 2 builtin
 
+COMPACT_SIZE = 8  # Largest condition or effect list kept as a tuple by compact
 
-class Action:
+
+class Action(object):
 
     # -----------------------------------------------
     # Initialize
@@ -54,6 +61,15 @@ class Action:
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
 
+    # -----------------------------------------------
+    # Encode
+    # -----------------------------------------------
+
+    def encode(self, table):
+        # Bitset masks over an AtomTable
+        return (table.encode(self.positive_preconditions), table.encode(self.negative_preconditions),
+                table.encode(self.add_effects), table.encode(self.del_effects))
+
     # -----------------------------------------------
     # Groundify
     # -----------------------------------------------
@@ -62,8 +78,16 @@ class Action:
         if not self.parameters:
             yield self
             return
+        instantiate = ActionTemplate(self).instantiate
+        for assignment in itertools.product(*self.type_map(objects, types)):
+            yield instantiate(assignment)
+
+    # -----------------------------------------------
+    # Type map
+    # -----------------------------------------------
+
+    def type_map(self, objects, types):
         type_map = []
-        variables = []
         for var, type in self.parameters:
             type_stack = [type]
             items = []
@@ -74,13 +98,7 @@ class Action:
                 if t in types:
                     type_stack += types[t]
             type_map.append(items)
-            variables.append(var)
-        for assignment in itertools.product(*type_map):
-            positive_preconditions = self.replace(self.positive_preconditions, variables, assignment)
-            negative_preconditions = self.replace(self.negative_preconditions, variables, assignment)
-            add_effects = self.replace(self.add_effects, variables, assignment)
-            del_effects = self.replace(self.del_effects, variables, assignment)
-            yield Action(self.name, assignment, positive_preconditions, negative_preconditions, add_effects, del_effects)
+        return type_map
 
     # -----------------------------------------------
     # Replace
@@ -97,6 +115,123 @@ class Action:
         return new_group
 
 
+class ActionTemplate:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, action):
+        # Each predicate becomes an itemgetter over the assignment followed by constants
+        self.name = action.name
+        self.slots = slots = dict((var, j) for j, (var, _) in enumerate(action.parameters))
+        self.constants = ()
+        self.positive_preconditions = self.compile(action.positive_preconditions)
+        self.negative_preconditions = self.compile(action.negative_preconditions)
+        self.add_effects = self.compile(action.add_effects)
+        self.del_effects = self.compile(action.del_effects)
+
+    # -----------------------------------------------
+    # Compile
+    # -----------------------------------------------
+
+    def compile(self, group):
+        getters = []
+        constant_atoms = []
+        constants = list(self.constants)
+        for pred in sorted(group):
+            if not any(t in self.slots for t in pred):
+                constant_atoms.append(pred)
+                continue
+            positions = []
+            for t in pred:
+                if t in self.slots:
+                    positions.append(self.slots[t])
+                else:
+                    if t not in constants:
+                        constants.append(t)
+                    positions.append(len(self.slots) + constants.index(t))
+            getters.append(itemgetter(*positions))
+        self.constants = tuple(constants)
+        return tuple(getters), constant_atoms
+
+    # -----------------------------------------------
+    # Instantiate
+    # -----------------------------------------------
+
+    def instantiate(self, assignment):
+        values = assignment + self.constants
+        act = Action.__new__(Action)
+        act.name = self.name
+        act.parameters = assignment
+        getters, atoms = self.positive_preconditions
+        act.positive_preconditions = frozenset([g(values) for g in getters] + atoms)
+        getters, atoms = self.negative_preconditions
+        act.negative_preconditions = frozenset([g(values) for g in getters] + atoms)
+        getters, atoms = self.add_effects
+        act.add_effects = frozenset([g(values) for g in getters] + atoms)
+        getters, atoms = self.del_effects
+        act.del_effects = frozenset([g(values) for g in getters] + atoms)
+        return act
+
+
+class GroundAction(object):
+
+    # Ground action without instance dictionary, every ground action is unique
+    # so hash and equality are by identity
+    __slots__ = ('name', 'parameters', 'positive_preconditions', 'negative_preconditions', 'add_effects', 'del_effects')
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, name, parameters, positive_preconditions, negative_preconditions, add_effects, del_effects):
+        self.name = name
+        self.parameters = parameters
+        self.positive_preconditions = positive_preconditions
+        self.negative_preconditions = negative_preconditions
+        self.add_effects = add_effects
+        self.del_effects = del_effects
+
+    # -----------------------------------------------
+    # to String, Encode
+    # -----------------------------------------------
+
+    __str__ = Action.__dict__['__str__']
+    encode = Action.__dict__['encode']
+
+    # -----------------------------------------------
+    # Equality
+    # -----------------------------------------------
+
+    __hash__ = object.__hash__
+
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+# -----------------------------------------------
+# Compact
+# -----------------------------------------------
+
+def compact(actions):
+    # GroundActions with interned names and objects, equal atoms share one tuple and
+    # condition and effect lists up to COMPACT_SIZE atoms become tuples
+    atoms = {}
+    def share(group):
+        shared = []
+        for atom in group:
+            atom_shared = atoms.get(atom)
+            if atom_shared is None:
+                atom_shared = atoms[atom] = tuple([intern(t) for t in atom])
+            shared.append(atom_shared)
+        return tuple(shared) if len(shared) <= COMPACT_SIZE else frozenset(shared)
+    return [GroundAction(intern(act.name), tuple([intern(p) for p in act.parameters]),
+                         share(act.positive_preconditions), share(act.negative_preconditions),
+                         share(act.add_effects), share(act.del_effects)) for act in actions]
+
 # -----------------------------------------------
 # Main
 # -----------------------------------------------
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import glob, multiprocessing, os, signal, time
+from .PDDL import PDDL_Parser
+from .planner import Planner
+
+_domain = None
+
+
+class TimeLimit(Exception):
+    pass
+
+# -----------------------------------------------
+# Solve batch
+# -----------------------------------------------
+
+def solve_batch(domain, problems, workers=None, time_limit=None, memory_limit=None, **options):
+    # Domain is parsed once and sent to each worker, results are yielded as
+    # (problem, plan, status, seconds) in completion order
+    parser = PDDL_Parser()
+    parser.parse_domain(domain)
+    pool = multiprocessing.Pool(workers, initialize, (parser, memory_limit))
+    try:
+        for result in pool.imap_unordered(solve, [(problem, time_limit, options) for problem in problems]):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+# -----------------------------------------------
+# Worker
+# -----------------------------------------------
+
+def initialize(parser, memory_limit):
+    global _domain
+    _domain = parser
+    if memory_limit:
+        import resource
+        limit = int(memory_limit * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def alarm(signum, frame):
+    raise TimeLimit()
+
+def solve(args):
+    problem, time_limit, options = args
+    start_time = time.time()
+    if time_limit:
+        signal.signal(signal.SIGALRM, alarm)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        plan = Planner().solve(_domain, problem, **options)
+        status = 'solved' if plan is not None else 'unsolvable'
+    except TimeLimit:
+        plan, status = None, 'timeout'
+    except MemoryError:
+        plan, status = None, 'memout'
+    except Exception as e:
+        plan, status = None, 'error: ' + str(e)
+    finally:
+        if time_limit:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return problem, plan, status, time.time() - start_time
+
+# -----------------------------------------------
+# Problem files
+# -----------------------------------------------
+
+def problem_files(domain, pattern):
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.pddl')
+    domain = os.path.abspath(domain)
+    return sorted(f for f in glob.glob(pattern) if os.path.abspath(f) != domain)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse, sys
+    from .heuristic import HEURISTICS
+    from .search import SEARCHES
+    argparser = argparse.ArgumentParser(description='Solve many PDDL problems of a domain in parallel')
+    argparser.add_argument('domain')
+    argparser.add_argument('problems', help='directory or glob of problem files')
+    argparser.add_argument('-j', type=int, help='number of worker processes')
+    argparser.add_argument('-t', type=float, help='time limit per problem in seconds')
+    argparser.add_argument('-m', type=float, help='memory limit per worker in MB')
+    argparser.add_argument('-v', action='store_true', help='print plans')
+    argparser.add_argument('-s', default='bfs', choices=sorted(SEARCHES), help='search algorithm')
+    argparser.add_argument('-H', default='hff', choices=sorted(HEURISTICS), help='heuristic')
+    args = argparser.parse_args()
+    problems = problem_files(args.domain, args.problems)
+    if not problems:
+        sys.exit('No problem files found')
+    start_time = time.time()
+    solved = 0
+    for problem, plan, status, seconds in solve_batch(args.domain, problems, args.j, args.t, args.m, search=args.s, heuristic=args.H):
+        if plan is not None:
+            solved += 1
+            status += ' ' + str(len(plan))
+        print(problem + ': ' + status + ' ' + str(seconds) + 's')
+        if args.v and plan:
+            for act in plan:
+                print('  ' + act.name + ' ' + ' '.join(act.parameters))
+    print('Solved ' + str(solved) + '/' + str(len(problems)) + ' in ' + str(time.time() - start_time) + 's')
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+class AtomTable:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, atoms=()):
+        self.ids = {}
+        self.atoms = []
+        for atom in atoms:
+            self.intern(atom)
+
+    def __len__(self):
+        return len(self.atoms)
+
+    # -----------------------------------------------
+    # Intern
+    # -----------------------------------------------
+
+    def intern(self, atom):
+        i = self.ids.get(atom)
+        if i is None:
+            i = self.ids[atom] = len(self.atoms)
+            self.atoms.append(atom)
+        return i
+
+    # -----------------------------------------------
+    # Encode
+    # -----------------------------------------------
+
+    def encode(self, atoms):
+        bits = 0
+        for atom in atoms:
+            bits |= 1 << self.intern(atom)
+        return bits
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def indices(self, bits):
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def decode(self, bits):
+        atoms = self.atoms
+        return frozenset([atoms[i] for i in self.indices(bits)])
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    table = AtomTable()
+    bits = table.encode([('at', 'ana', 'p1'), ('adjacent', 'p1', 'p2')])
+    print(bin(bits))
+    print(table.decode(bits | table.encode([('at', 'bob', 'p2')])))
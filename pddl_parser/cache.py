@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import hashlib, os, pickle, tempfile, zlib
+from collections import OrderedDict
+
+FORMAT = 1
+
+
+# -----------------------------------------------
+# Source version
+# -----------------------------------------------
+
+def source_version():
+    # Entries are invalidated by any change in parser or grounding source
+    digest = hashlib.sha1(str(FORMAT).encode())
+    package = os.path.dirname(os.path.abspath(__file__))
+    for name in ['PDDL.py', 'action.py', 'grounding.py']:
+        with open(os.path.join(package, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class Cache:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, directory, max_size=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        self.version = source_version()
+
+    # -----------------------------------------------
+    # Key
+    # -----------------------------------------------
+
+    def key(self, filenames, *options):
+        digest = hashlib.sha1(self.version.encode())
+        for filename in filenames:
+            with open(filename, 'rb') as f:
+                digest.update(hashlib.sha1(f.read()).digest())
+        digest.update(repr(options).encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.cache')
+
+    # -----------------------------------------------
+    # Load
+    # -----------------------------------------------
+
+    def load(self, key):
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+        try:
+            return pickle.loads(zlib.decompress(data))
+        except Exception:
+            return None
+
+    # -----------------------------------------------
+    # Store
+    # -----------------------------------------------
+
+    def store(self, key, value):
+        # Written to a temporary file and renamed, readers never see partial entries
+        data = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.rename(temp, self.path(key))
+        except (IOError, OSError):
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    # -----------------------------------------------
+    # Evict
+    # -----------------------------------------------
+
+    def evict(self):
+        # Least recently used entries go first, other processes may remove them concurrently
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if name.endswith('.cache'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name, stat.st_size))
+                total += stat.st_size
+        entries.sort()
+        while total > self.max_size and entries:
+            _, name, size = entries.pop(0)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+class MemoryCache(Cache):
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, max_entries=32):
+        # Entries are kept as objects in least recently used order, nothing is copied
+        self.max_entries = max_entries
+        self.version = source_version()
+        self.entries = OrderedDict()
+
+    # -----------------------------------------------
+    # Load
+    # -----------------------------------------------
+
+    def load(self, key):
+        value = self.entries.pop(key, None)
+        if value is not None:
+            self.entries[key] = value
+        return value
+
+    # -----------------------------------------------
+    # Store
+    # -----------------------------------------------
+
+    def store(self, key, value):
+        self.entries.pop(key, None)
+        self.entries[key] = value
+        self.evict()
+
+    # -----------------------------------------------
+    # Evict
+    # -----------------------------------------------
+
+    def evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
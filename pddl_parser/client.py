@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import json, os, socket, tempfile
+from contextlib import closing
+
+# Only the standard library is imported, the planner is already loaded by the server
+SOCKET = os.path.join(tempfile.gettempdir(), 'pddl-planner-' + str(os.getuid()) + '.sock')
+
+# -----------------------------------------------
+# Request
+# -----------------------------------------------
+
+def request(message, path=SOCKET):
+    # One JSON object per line in each direction
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+        connection.sendall((json.dumps(message) + '\n').encode())
+        with closing(connection.makefile('rb')) as f:
+            line = f.readline()
+    finally:
+        connection.close()
+    if not line:
+        raise Exception('Server closed connection')
+    return json.loads(line.decode())
+
+def solve(domain, problem, path=SOCKET, time_limit=None, **options):
+    message = {'domain': os.path.abspath(domain), 'problem': os.path.abspath(problem), 'options': options}
+    if time_limit:
+        message['time_limit'] = time_limit
+    return request(message, path)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse, sys
+    argparser = argparse.ArgumentParser(description='Solve a PDDL problem with a running planner server')
+    argparser.add_argument('domain', nargs='?')
+    argparser.add_argument('problem', nargs='?')
+    argparser.add_argument('-S', default=SOCKET, metavar='PATH', help='server socket')
+    argparser.add_argument('-r', default='set', help='state representation')
+    argparser.add_argument('-s', default='bfs', help='search algorithm')
+    argparser.add_argument('-H', default='hff', help='heuristic')
+    argparser.add_argument('-w', default=5, type=float, help='weighted A* weight')
+    argparser.add_argument('-t', type=float, help='time limit in seconds')
+    argparser.add_argument('-p', action='store_true', help='print statistics')
+    argparser.add_argument('--ping', action='store_true', help='check that the server is running')
+    argparser.add_argument('--shutdown', action='store_true', help='stop the server')
+    args = argparser.parse_args()
+    if args.ping or args.shutdown:
+        print(request({'command': 'shutdown' if args.shutdown else 'ping'}, args.S)['status'])
+        sys.exit()
+    if not args.problem:
+        argparser.error('domain and problem are required')
+    response = solve(args.domain, args.problem, args.S, args.t, representation=args.r, search=args.s, heuristic=args.H, weight=args.w)
+    print('Time: ' + str(response['time']) + 's' + (' (cached)' if response.get('cached') else ''))
+    if args.p and 'statistics' in response:
+        for name, value in sorted(response['statistics'].items()):
+            print(name + ': ' + str(value))
+    if response['plan'] is not None:
+        print('plan:')
+        for act in response['plan']:
+            print(' '.join(act))
+    else:
+        sys.exit('No plan was found: ' + response['status'])
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import heapq, os, shutil, struct, sys, tempfile
+from binascii import hexlify, unhexlify
+from .sas import SASTask
+from .statistics import Statistics
+from .task import BitsetTask
+from .vectorized import NumpyTask
+
+RECORD = struct.Struct('>ql')  # Position of the parent in the previous layer and action
+
+# -----------------------------------------------
+# External breadth-first search
+# -----------------------------------------------
+
+def external_breadth_first_search(task, memory_budget=64, directory=None, statistics=None):
+    # Delayed duplicate detection, successors of a layer are buffered up to memory_budget MB
+    # and written as sorted runs, the merged runs minus the sorted file of visited states
+    # become the next layer, layer files keep records of state, parent and action
+    if statistics is None:
+        statistics = Statistics()
+    if task.goal_reached(task.initial_state):
+        return []
+    width, pack, unpack = codec(task)
+    size = width + RECORD.size
+    buffer_limit = max(1, int(memory_budget * 1048576 / (sys.getsizeof(b'') + size + 8)))
+    directory = tempfile.mkdtemp(prefix='ebfs-', dir=directory)
+    layers = [os.path.join(directory, 'layer0')]
+    closed = os.path.join(directory, 'closed0')
+    with open(layers[0], 'wb') as f:
+        f.write(pack(task.initial_state) + RECORD.pack(-1, -1))
+    with open(closed, 'wb') as f:
+        f.write(pack(task.initial_state))
+    layer_size = 1
+    statistics.peak_closed = 1
+    peak_buffer = 0
+    try:
+        while True:
+            # Expand layer into sorted runs
+            runs = []
+            buffer = []
+            with open(layers[-1], 'rb') as f:
+                for j, record in enumerate(read_records(f, size)):
+                    statistics.expanded += 1
+                    statistics.progress(layer_size - j)
+                    for i, new_state in task.successors(unpack(record[:width])):
+                        statistics.generated += 1
+                        buffer.append(pack(new_state) + RECORD.pack(j, i))
+                        if len(buffer) >= buffer_limit:
+                            peak_buffer = max(peak_buffer, len(buffer))
+                            runs.append(write_run(directory, len(runs), buffer))
+                            buffer = []
+            if buffer:
+                peak_buffer = max(peak_buffer, len(buffer))
+                runs.append(write_run(directory, len(runs), buffer))
+                buffer = []
+            # Merge runs, keep the first record of each state not visited before
+            layer = os.path.join(directory, 'layer' + str(len(layers)))
+            new_closed = os.path.join(directory, 'closed' + str(len(layers)))
+            run_files = [open(run, 'rb') for run in runs]
+            goal = None
+            layer_size = 0
+            try:
+                with open(closed, 'rb') as closed_file, open(new_closed, 'wb') as closed_out, open(layer, 'wb') as layer_out:
+                    visited = read_records(closed_file, width)
+                    seen = next(visited, None)
+                    previous = None
+                    for record in heapq.merge(*[read_records(f, size) for f in run_files]):
+                        state = record[:width]
+                        if state == previous:
+                            statistics.duplicates += 1
+                            continue
+                        previous = state
+                        while seen is not None and seen < state:
+                            closed_out.write(seen)
+                            seen = next(visited, None)
+                        if seen == state:
+                            statistics.duplicates += 1
+                            continue
+                        closed_out.write(state)
+                        layer_out.write(record)
+                        layer_size += 1
+                        if task.goal_reached(unpack(state)):
+                            goal = layer_size - 1
+                            break
+                    while seen is not None:
+                        closed_out.write(seen)
+                        seen = next(visited, None)
+            finally:
+                for f in run_files:
+                    f.close()
+                for run in runs:
+                    os.remove(run)
+            os.remove(closed)
+            closed = new_closed
+            layers.append(layer)
+            statistics.peak_closed += layer_size
+            if goal is not None:
+                return layer_plan(layers, goal, width, size)
+            if not layer_size:
+                return None
+    finally:
+        # Bytes of successor records held in memory, visited states are on disk
+        statistics.bytes_per_node = peak_buffer * (sys.getsizeof(b'') + size + 8) / float(statistics.peak_closed)
+        shutil.rmtree(directory)
+
+# -----------------------------------------------
+# Codec
+# -----------------------------------------------
+
+def codec(task):
+    # Fixed width byte strings whose order is the same for equal states
+    if isinstance(task, BitsetTask):
+        width = (len(task.table) + 7) // 8 or 1
+        return width, lambda state: unhexlify('%0*x' % (2 * width, state)), lambda data: int(hexlify(data), 16)
+    if isinstance(task, SASTask) and task.pack is bytes and task.variables:
+        return len(task.variables), bytes, bytes
+    if isinstance(task, NumpyTask) and task.width:
+        return task.width, bytes, bytes
+    raise Exception('External search requires bitset, sas or numpy states with at least one variable')
+
+# -----------------------------------------------
+# Files
+# -----------------------------------------------
+
+def read_records(f, size):
+    while True:
+        record = f.read(size)
+        if len(record) < size:
+            return
+        yield record
+
+def write_run(directory, number, buffer):
+    buffer.sort()
+    filename = os.path.join(directory, 'run' + str(number))
+    with open(filename, 'wb') as f:
+        f.write(b''.join(buffer))
+    return filename
+
+def layer_plan(layers, node, width, size):
+    # Follow parent positions back through the layer files
+    plan = []
+    for filename in reversed(layers):
+        with open(filename, 'rb') as f:
+            f.seek(node * size)
+            parent, action = RECORD.unpack(f.read(size)[width:])
+        if parent == -1:
+            break
+        plan.append(action)
+        node = parent
+    plan.reverse()
+    return plan
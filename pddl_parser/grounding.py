@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import gc, itertools, marshal, multiprocessing
+from .action import Action, ActionTemplate, COMPACT_SIZE, GroundAction, compact as compact_actions
+try:
+    from sys import intern
+except ImportError:
+    pass  # Python 2 builtin
+
+_schemas = None
+_compact = False
+
+
+# -----------------------------------------------
+# Ground
+# -----------------------------------------------
+
+def ground(actions, state, objects, types, reachable=True, workers=None, compact=False):
+    # Cyclic garbage collection is paused, ground actions are many objects without cycles
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if reachable:
+            if workers:
+                raise Exception('Parallel grounding requires exhaustive grounding')
+            ground_actions = ground_reachable(actions, state, objects, types)
+        elif workers:
+            return ground_parallel(actions, objects, types, workers, compact=compact)
+        else:
+            ground_actions = []
+            for action in actions:
+                for act in action.groundify(objects, types):
+                    ground_actions.append(act)
+        return compact_actions(ground_actions) if compact else ground_actions
+    finally:
+        if enabled:
+            gc.enable()
+
+# -----------------------------------------------
+# Ground parallel
+# -----------------------------------------------
+
+def ground_parallel(actions, objects, types, workers=None, chunk_size=10000, compact=False):
+    # Exhaustive grounding with the assignments of each schema split in ranges of chunk_size,
+    # workers send each range as one marshal string of final groups and ranges are merged
+    # in order, only the objects holding the groups are made here
+    chunks = []
+    for s, action in enumerate(actions):
+        total = 1
+        for items in action.type_map(objects, types):
+            total *= len(items)
+        for start in range(0, total, chunk_size):
+            chunks.append((s, start, min(chunk_size, total - start)))
+    pool = multiprocessing.Pool(workers, initialize_grounding, (actions, objects, types, compact))
+    try:
+        cls = GroundAction if compact else Action
+        new = cls.__new__
+        ground_actions = []
+        for s, data in pool.imap(ground_chunk, chunks):
+            name = intern(actions[s].name) if compact else actions[s].name
+            for parameters, positive, negative, add, delete in marshal.loads(data):
+                act = new(cls)
+                act.name = name
+                act.parameters = parameters
+                act.positive_preconditions = positive
+                act.negative_preconditions = negative
+                act.add_effects = add
+                act.del_effects = delete
+                ground_actions.append(act)
+        return ground_actions
+    finally:
+        pool.terminate()
+        pool.join()
+
+def initialize_grounding(actions, objects, types, compact):
+    global _schemas, _compact
+    gc.disable()
+    _schemas = [(ActionTemplate(action).instantiate, action.type_map(objects, types)) for action in actions]
+    _compact = compact
+
+def ground_chunk(chunk):
+    # Equal atoms of a range are one object, written once by marshal and loaded once,
+    # compact groups are tuples of interned atoms as made by compact
+    s, start, count = chunk
+    instantiate, type_map = _schemas[s]
+    atoms = {}
+    def share(group):
+        shared = []
+        for atom in group:
+            atom_shared = atoms.get(atom)
+            if atom_shared is None:
+                atom_shared = atoms[atom] = tuple([intern(t) for t in atom]) if _compact else atom
+            shared.append(atom_shared)
+        return tuple(shared) if _compact and len(shared) <= COMPACT_SIZE else frozenset(shared)
+    data = []
+    for assignment in assignments(type_map, start, count):
+        act = instantiate(assignment)
+        parameters = tuple([intern(p) for p in assignment]) if _compact else act.parameters
+        data.append((parameters, share(act.positive_preconditions), share(act.negative_preconditions), share(act.add_effects), share(act.del_effects)))
+    return s, marshal.dumps(data)
+
+def assignments(type_map, start, count):
+    # Count assignments of itertools.product(*type_map) from the mixed-radix digits of start,
+    # each piece fixes a prefix and continues the next parameter after its digit
+    digits = []
+    for items in reversed(type_map):
+        start, digit = divmod(start, len(items))
+        digits.append(digit)
+    digits.reverse()
+    pieces = []
+    for k in range(len(type_map) - 1, -1, -1):
+        first = digits[k] if k == len(type_map) - 1 else digits[k] + 1
+        pieces.append(itertools.product(*[[type_map[j][digits[j]]] for j in range(k)] + [type_map[k][first:]] + type_map[k + 1:]))
+    if not type_map:
+        pieces.append([()])
+    return itertools.islice(itertools.chain(*pieces), count)
+
+# -----------------------------------------------
+# Static predicates
+# -----------------------------------------------
+
+def static_predicates(actions):
+    # Predicates never modified by any action keep their initial value
+    fluent = set()
+    used = set()
+    for action in actions:
+        for pred in action.add_effects:
+            fluent.add(pred[0])
+        for pred in action.del_effects:
+            fluent.add(pred[0])
+        for pred in action.positive_preconditions:
+            used.add(pred[0])
+        for pred in action.negative_preconditions:
+            used.add(pred[0])
+    return used.difference(fluent)
+
+# -----------------------------------------------
+# Ground reachable
+# -----------------------------------------------
+
+def ground_reachable(actions, state, objects, types):
+    # Relaxed reachability fixpoint, each round joins schema preconditions
+    # against reached atoms with at least one atom reached in the last round
+    statics = static_predicates(actions)
+    schemas = []
+    for action in actions:
+        variables = dict((var, j) for j, (var, _) in enumerate(action.parameters))
+        order = []
+        for items in action.type_map(objects, types):
+            positions = {}
+            for i, obj in enumerate(items):
+                positions.setdefault(obj, i)
+            order.append(positions)
+        positive = sorted(action.positive_preconditions)
+        negative = [pred for pred in action.negative_preconditions if pred[0] in statics]
+        schemas.append((variables, order, positive, negative))
+    found = [set() for _ in actions]
+    reached = set()
+    index = {}
+    delta = set(state)
+    first = True
+    while delta:
+        reached.update(delta)
+        delta_index = {}
+        for atom in delta:
+            index.setdefault(atom[0], []).append(atom)
+            delta_index.setdefault(atom[0], []).append(atom)
+        new = set()
+        for s, action in enumerate(actions):
+            variables, order, positive, negative = schemas[s]
+            bindings = []
+            if first:
+                join(positive, 0, [None] * len(order), variables, order, index, reached, bindings)
+            else:
+                for k, pred in enumerate(positive):
+                    rest = positive[:k] + positive[k + 1:]
+                    for atom in delta_index.get(pred[0], ()):
+                        binding = match(pred, atom, [None] * len(order), variables, order)
+                        if binding is not None:
+                            join(rest, 0, binding, variables, order, index, reached, bindings)
+            for binding in bindings:
+                free = [j for j, value in enumerate(binding) if value is None]
+                for values in itertools.product(*[list(order[j]) for j in free]):
+                    for j, value in zip(free, values):
+                        binding[j] = value
+                    assignment = tuple(binding)
+                    if assignment in found[s]:
+                        continue
+                    if any(substitute(pred, variables, assignment) in state for pred in negative):
+                        continue
+                    found[s].add(assignment)
+                    for pred in action.add_effects:
+                        atom = substitute(pred, variables, assignment)
+                        if atom not in reached:
+                            new.add(atom)
+        delta = new
+        first = False
+    # Keep the relative order of exhaustive grounding
+    ground_actions = []
+    for s, action in enumerate(actions):
+        if not action.parameters:
+            if found[s]:
+                ground_actions.append(action)
+            continue
+        instantiate = ActionTemplate(action).instantiate
+        order = schemas[s][1]
+        for assignment in sorted(found[s], key=lambda a: [order[j][value] for j, value in enumerate(a)]):
+            ground_actions.append(instantiate(assignment))
+    return ground_actions
+
+# -----------------------------------------------
+# Join
+# -----------------------------------------------
+
+def join(predicates, i, binding, variables, order, index, reached, bindings):
+    if i == len(predicates):
+        bindings.append(binding)
+        return
+    pred = predicates[i]
+    if all(t not in variables or binding[variables[t]] is not None for t in pred):
+        if substitute(pred, variables, binding) in reached:
+            join(predicates, i + 1, binding, variables, order, index, reached, bindings)
+        return
+    for atom in index.get(pred[0], ()):
+        new_binding = match(pred, atom, list(binding), variables, order)
+        if new_binding is not None:
+            join(predicates, i + 1, new_binding, variables, order, index, reached, bindings)
+
+# -----------------------------------------------
+# Match
+# -----------------------------------------------
+
+def match(pred, atom, binding, variables, order):
+    if len(pred) != len(atom):
+        return None
+    for t, value in zip(pred, atom):
+        j = variables.get(t)
+        if j is None:
+            if t != value:
+                return None
+        elif binding[j] is None:
+            if value not in order[j]:
+                return None
+            binding[j] = value
+        elif binding[j] != value:
+            return None
+    return binding
+
+# -----------------------------------------------
+# Substitute
+# -----------------------------------------------
+
+def substitute(pred, variables, assignment):
+    return tuple([assignment[variables[t]] if t in variables else t for t in pred])
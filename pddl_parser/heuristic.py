@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import heapq
+
+INFINITY = float('inf')
+
+
+class Heuristic:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, task):
+        # Delete relaxation over interned atoms, negative conditions are ignored
+        self.task = task
+        self.ids = ids = {}
+        def intern(atoms):
+            return [ids.setdefault(atom, len(ids)) for atom in atoms]
+        self.preconditions = []
+        self.add_effects = []
+        for act in task.actions:
+            self.preconditions.append(intern(act.positive_preconditions))
+            self.add_effects.append(intern(act.add_effects))
+        self.goals = intern(task.goal_atoms())
+        self.precondition_of = [[] for _ in ids]
+        self.unconditional = []
+        for i, pre in enumerate(self.preconditions):
+            for atom in pre:
+                self.precondition_of[atom].append(i)
+            if not pre:
+                self.unconditional.append(i)
+
+    # -----------------------------------------------
+    # Evaluate
+    # -----------------------------------------------
+
+    def __call__(self, state):
+        cost, supporter = self.explore(state)
+        return self.estimate(cost, supporter)
+
+    def explore(self, state):
+        # Generalized Dijkstra with unit action costs
+        ids = self.ids
+        cost = [INFINITY] * len(ids)
+        supporter = [None] * len(ids)
+        unsatisfied = [len(pre) for pre in self.preconditions]
+        action_cost = [0] * len(self.preconditions)
+        heap = []
+        for atom in self.task.decode(state):
+            i = ids.get(atom)
+            if i is not None:
+                cost[i] = 0
+                heap.append((0, i))
+        for op in self.unconditional:
+            self.relax(op, 1, cost, supporter, heap)
+        done = [False] * len(ids)
+        combine = self.combine
+        while heap:
+            c, atom = heapq.heappop(heap)
+            if done[atom]:
+                continue
+            done[atom] = True
+            for op in self.precondition_of[atom]:
+                action_cost[op] = combine(action_cost[op], c)
+                unsatisfied[op] -= 1
+                if not unsatisfied[op]:
+                    self.relax(op, action_cost[op] + 1, cost, supporter, heap)
+        return cost, supporter
+
+    def relax(self, op, c, cost, supporter, heap):
+        for atom in self.add_effects[op]:
+            if c < cost[atom]:
+                cost[atom] = c
+                supporter[atom] = op
+                heapq.heappush(heap, (c, atom))
+
+
+class HMax(Heuristic):
+
+    combine = staticmethod(max)
+
+    def estimate(self, cost, supporter):
+        return max([cost[g] for g in self.goals] or [0])
+
+
+class HAdd(Heuristic):
+
+    @staticmethod
+    def combine(a, b):
+        return a + b
+
+    def estimate(self, cost, supporter):
+        return sum([cost[g] for g in self.goals])
+
+
+class HFF(HAdd):
+
+    def estimate(self, cost, supporter):
+        # Relaxed plan extracted from h_add best supporters
+        if any(cost[g] == INFINITY for g in self.goals):
+            return INFINITY
+        plan = set()
+        stack = list(self.goals)
+        seen = set(stack)
+        while stack:
+            op = supporter[stack.pop()]
+            if op is not None and op not in plan:
+                plan.add(op)
+                for atom in self.preconditions[op]:
+                    if atom not in seen:
+                        seen.add(atom)
+                        stack.append(atom)
+        return len(plan)
+
+
+HEURISTICS = {'hmax': HMax, 'hadd': HAdd, 'hff': HFF}
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import itertools
+from .action import ActionTemplate
+from .grounding import join, substitute
+from .task import Task
+
+
+class LazyTask(Task):
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, schemas, state, objects, types, positive_goals, negative_goals):
+        # Ground actions are instantiated when first applicable and keep the id given then,
+        # actions holds only the instantiated ones
+        self.actions = []
+        self.ids = {}
+        self.initial_state = state
+        self.positive_goals = positive_goals
+        self.negative_goals = negative_goals
+        self.generator = None
+        self.schemas = []
+        for action in schemas:
+            variables = dict((var, j) for j, (var, _) in enumerate(action.parameters))
+            order = []
+            for items in action.type_map(objects, types):
+                positions = {}
+                for i, obj in enumerate(items):
+                    positions.setdefault(obj, i)
+                order.append(positions)
+            instantiate = ActionTemplate(action).instantiate if action.parameters else lambda assignment, action=action: action
+            self.schemas.append((variables, order, sorted(action.positive_preconditions), list(action.negative_preconditions), instantiate))
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        # Join schema preconditions against state atoms indexed by predicate,
+        # bindings follow the order of exhaustive grounding
+        index = {}
+        for atom in state:
+            index.setdefault(atom[0], []).append(atom)
+        actions = self.actions
+        ids = self.ids
+        for s, (variables, order, positive, negative, instantiate) in enumerate(self.schemas):
+            bindings = []
+            join(positive, 0, [None] * len(order), variables, order, index, state, bindings)
+            assignments = set()
+            for binding in bindings:
+                free = [j for j, value in enumerate(binding) if value is None]
+                for values in itertools.product(*[list(order[j]) for j in free]):
+                    for j, value in zip(free, values):
+                        binding[j] = value
+                    assignments.add(tuple(binding))
+            for assignment in sorted(assignments, key=lambda a: [order[j][value] for j, value in enumerate(a)]):
+                if any(substitute(pred, variables, assignment) in state for pred in negative):
+                    continue
+                i = ids.get((s, assignment))
+                if i is None:
+                    i = ids[(s, assignment)] = len(actions)
+                    actions.append(instantiate(assignment))
+                act = actions[i]
+                yield i, state.difference(act.del_effects).union(act.add_effects)
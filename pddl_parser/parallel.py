@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import multiprocessing, numbers, zlib
+from .statistics import Statistics
+from .symmetry import CanonicalState
+from .task import ZobristState
+
+# -----------------------------------------------
+# Parallel breadth-first search
+# -----------------------------------------------
+
+def parallel_breadth_first_search(task, workers=None, statistics=None):
+    # Layer-synchronous BFS over worker processes, each worker owns the states with
+    # partition_key(state) % workers equal to its partition, expands them and sends successors
+    # to their owners, which keep the first copy from the lowest sender
+    if statistics is None:
+        statistics = Statistics()
+    if task.goal_reached(task.initial_state):
+        return []
+    workers = workers or multiprocessing.cpu_count()
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    connections = []
+    processes = []
+    for p in range(workers):
+        connection, worker_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=worker, args=(task, p, workers, worker_connection, inboxes))
+        process.daemon = True
+        process.start()
+        connections.append(connection)
+        processes.append(process)
+    def broadcast(command):
+        for connection in connections:
+            connection.send(command)
+        return [connection.recv() for connection in connections]
+    try:
+        while True:
+            goal = None
+            for expanded, generated, duplicates, found in broadcast(('expand',)):
+                statistics.expanded += expanded
+                statistics.generated += generated
+                statistics.duplicates += duplicates
+                if goal is None:
+                    goal = found
+            if goal is not None:
+                # Follow parent references through their owners
+                ref, action = goal
+                plan = [action]
+                while ref != -1:
+                    connection = connections[ref % workers]
+                    connection.send(('parent', ref // workers))
+                    ref, action = connection.recv()
+                    if ref != -1:
+                        plan.append(action)
+                plan.reverse()
+                return plan
+            frontier = 0
+            for added, duplicates in broadcast(('merge',)):
+                frontier += added
+                statistics.duplicates += duplicates
+            statistics.peak_open = max(statistics.peak_open, frontier)
+            statistics.notify('progress')
+            if not frontier:
+                return None
+    finally:
+        nodes = 0
+        memory = 0
+        for connection in connections:
+            connection.send(('stop',))
+        for connection in connections:
+            closed, size = connection.recv()
+            nodes += closed
+            memory += size
+        for process in processes:
+            process.terminate()
+            process.join()
+        statistics.peak_closed = nodes
+        statistics.bytes_per_node = memory / float(max(nodes, 1))
+
+# -----------------------------------------------
+# Worker
+# -----------------------------------------------
+
+def worker(task, partition, workers, connection, inboxes):
+    # Parent references are node * workers + partition of the owner
+    from .search import NodeStore
+    store = NodeStore()
+    visited = {}
+    frontier = []
+    state = task.initial_state
+    if partition_key(state) % workers == partition:
+        visited[state] = store.add(state)
+        frontier.append(visited[state])
+    while True:
+        command = connection.recv()
+        if command[0] == 'expand':
+            buckets = [{} for _ in range(workers)]
+            generated = 0
+            duplicates = 0
+            goal = None
+            for node in frontier:
+                ref = node * workers + partition
+                for i, new_state in task.successors(store.states[node]):
+                    generated += 1
+                    if task.goal_reached(new_state):
+                        goal = (ref, i)
+                        break
+                    bucket = buckets[partition_key(new_state) % workers]
+                    if new_state not in bucket and new_state not in visited:
+                        bucket[new_state] = (ref, i)
+                    else:
+                        duplicates += 1
+                if goal is not None:
+                    break
+            if goal is None:
+                for q, bucket in enumerate(buckets):
+                    inboxes[q].put((partition, list(bucket.items())))
+            connection.send((len(frontier), generated, duplicates, goal))
+        elif command[0] == 'merge':
+            messages = sorted([inboxes[partition].get() for _ in range(workers)], key=lambda message: message[0])
+            frontier = []
+            duplicates = 0
+            for _, successors in messages:
+                for new_state, (ref, i) in successors:
+                    if new_state in visited:
+                        duplicates += 1
+                    else:
+                        visited[new_state] = node = store.add(new_state, ref, i)
+                        frontier.append(node)
+            connection.send((len(frontier), duplicates))
+        elif command[0] == 'parent':
+            node = command[1]
+            connection.send((store.parents[node], store.actions[node]))
+        elif command[0] == 'stop':
+            connection.send((len(visited), store.memory(visited)))
+            return
+
+# -----------------------------------------------
+# Partition key
+# -----------------------------------------------
+
+def partition_key(state):
+    # Equal in every process, string hashes are randomized per process when workers
+    # are spawned instead of forked
+    if isinstance(state, ZobristState):
+        return state.key
+    if isinstance(state, CanonicalState):
+        return partition_key(state.key)
+    if isinstance(state, numbers.Integral):
+        return hash(state)
+    if isinstance(state, (bytes, bytearray)):
+        return zlib.crc32(state) & 0xffffffff
+    if isinstance(state, (frozenset, set)):
+        state = sorted(state)
+    return zlib.crc32(repr(state).encode('utf-8')) & 0xffffffff
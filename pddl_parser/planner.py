@@ -16,7 +16,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
+import copy, sys, time
 from .PDDL import PDDL_Parser
+from .action import compact as compact_actions
+from .cache import Cache
+from .grounding import ground
+from .heuristic import HEURISTICS
+from .lazy import LazyTask
+from .search import SEARCHES, breadth_first_search, collision_probability, external_breadth_first_search, parallel_breadth_first_search, weighted_astar_search
+from .sas import SASTask
+from .simplify import simplify as simplify_task
+from .statistics import Statistics
+from .stubborn import StubbornTask
+from .symmetry import SymmetryTask, object_classes
+from .task import Task, BitsetTask, ZobristTask
+from .vectorized import numpy_task
+
+REPRESENTATIONS = {'set': Task, 'bitset': BitsetTask, 'sas': SASTask, 'zobrist': ZobristTask, 'lazy': LazyTask, 'numpy': numpy_task}
 
 
 class Planner:
@@ -25,11 +41,48 @@ class Planner:
     # Solve
     # -----------------------------------------------
 
-    def solve(self, domain, problem):
-        # Parser
-        parser = PDDL_Parser()
-        parser.parse_domain(domain)
-        parser.parse_problem(problem)
+    def solve(self, domain, problem, representation='set', reachable=True, search='bfs', heuristic='hff', weight=5, cache=None, statistics=None, simplify=True, workers=None, fingerprint_bits=None, memory_budget=64, external_directory=None, ground_workers=None, compact=False, symmetry=False, stubborn=False, cache_key=None):
+        self.statistics = statistics = statistics if statistics is not None else Statistics()
+        self.object_classes = []
+        self.stubborn_pruned = 0
+        if representation not in REPRESENTATIONS:
+            raise Exception('Representation ' + representation + ' not supported')
+        if representation == 'lazy' and search != 'bfs':
+            raise Exception('Lazy representation supports only bfs search')
+        if fingerprint_bits and representation == 'bitset':
+            raise Exception('Fingerprints require well distributed state hashes, integer hashes are not')
+        if symmetry and representation != 'set':
+            raise Exception('Symmetry pruning requires set representation')
+        if stubborn and (representation == 'lazy' or symmetry):
+            raise Exception('Stubborn sets require ground actions and no symmetry pruning')
+        if ground_workers and reachable:
+            raise Exception('Parallel grounding requires exhaustive grounding')
+        # Cached parser and ground actions
+        entry = None
+        if cache is not None:
+            if isinstance(domain, PDDL_Parser):
+                raise Exception('Cache requires a domain filename')
+            if not isinstance(cache, Cache):
+                cache = Cache(cache)
+            with statistics.phase('cache'):
+                # Key may be given by a caller that already read the files
+                key = cache_key or cache.key([domain, problem], reachable)
+                entry = cache.load(key)
+        if entry:
+            parser, ground_actions = entry
+        else:
+            # Parser, domain may have been parsed before
+            start_time = time.time()
+            if isinstance(domain, PDDL_Parser):
+                parser = copy.deepcopy(domain)
+                parser.tokenize_time = 0.0
+            else:
+                parser = PDDL_Parser()
+                parser.parse_domain(domain)
+            parser.parse_problem(problem)
+            statistics.record('tokenize', parser.tokenize_time)
+            statistics.record('parse', time.time() - start_time - parser.tokenize_time)
+            ground_actions = None
         # Parsed data
         state = parser.state
         goal_pos = parser.positive_goals
@@ -37,38 +90,89 @@ class Planner:
         # Do nothing
         if self.applicable(state, goal_pos, goal_not):
             return []
-        # Grounding process
-        ground_actions = []
-        for action in parser.actions:
-            for act in action.groundify(parser.objects, parser.types):
-                ground_actions.append(act)
+        # Grounding process, lazy tasks instantiate actions during search
+        with statistics.phase('ground'):
+            if representation == 'lazy':
+                task = LazyTask(parser.actions, state, parser.objects, parser.types, goal_pos, goal_not)
+            else:
+                if ground_actions is None:
+                    # Cached ground actions are kept as Actions and compacted after loading
+                    ground_actions = ground(parser.actions, state, parser.objects, parser.types, reachable, ground_workers, compact and cache is None)
+                    if cache is not None:
+                        cache.store(key, (parser, ground_actions))
+                if compact and cache is not None:
+                    ground_actions = compact_actions(ground_actions)
+                statistics.ground_actions = len(ground_actions)
+                # Static atoms removed from states, actions and goals
+                if simplify:
+                    reduced = simplify_task(ground_actions, state, goal_pos, goal_not)
+                    if reduced is None:
+                        return None
+                    actions, origin, state, goal_pos, goal_not = reduced
+                else:
+                    actions = ground_actions
+                    origin = range(len(ground_actions))
+                # Interchangeable objects are found before static atoms are removed
+                if symmetry:
+                    self.object_classes = object_classes(parser.actions, parser.objects, parser.types, parser.state, parser.positive_goals, parser.negative_goals)
+                if self.object_classes:
+                    task = SymmetryTask(actions, state, goal_pos, goal_not, self.object_classes)
+                else:
+                    task = REPRESENTATIONS[representation](actions, state, goal_pos, goal_not)
+                # Partial-order reduction
+                if stubborn:
+                    task = StubbornTask(task, goal_pos, goal_not)
+            statistics.state_bytes = sys.getsizeof(task.initial_state)
         # Search
-        visited = set([state])
-        fringe = [state, None]
-        while fringe:
-            state = fringe.pop(0)
-            plan = fringe.pop(0)
-            for act in ground_actions:
-                if self.applicable(state, act.positive_preconditions, act.negative_preconditions):
-                    new_state = self.apply(state, act.add_effects, act.del_effects)
-                    if new_state not in visited:
-                        if self.applicable(new_state, goal_pos, goal_not):
-                            full_plan = [act]
-                            while plan:
-                                act, plan = plan
-                                full_plan.insert(0, act)
-                            return full_plan
-                        visited.add(new_state)
-                        fringe.append(new_state)
-                        fringe.append((act, plan))
-        return None
+        with statistics.phase('search'):
+            plan = self.search(task, search, heuristic, weight, statistics, workers, fingerprint_bits, memory_budget, external_directory)
+        if stubborn:
+            self.stubborn_pruned = task.pruned
+        if representation == 'lazy':
+            ground_actions = task.actions
+            origin = range(len(ground_actions))
+            statistics.ground_actions = len(ground_actions)
+        if plan is not None:
+            return [ground_actions[origin[i]] for i in plan]
+
+    # -----------------------------------------------
+    # Solve portfolio
+    # -----------------------------------------------
+
+    def solve_portfolio(self, domain, problem, configs=None, time_limit=None, best=False, **options):
+        # Imported here as portfolio workers import the planner
+        from .portfolio import solve_portfolio
+        plan, self.portfolio = solve_portfolio(domain, problem, configs, time_limit, best, **options)
+        return plan
+
+    # -----------------------------------------------
+    # Search
+    # -----------------------------------------------
+
+    def search(self, task, search='bfs', heuristic='hff', weight=5, statistics=None, workers=None, fingerprint_bits=None, memory_budget=64, external_directory=None):
+        if search not in SEARCHES:
+            raise Exception('Search ' + search + ' not supported')
+        if search == 'bfs':
+            return breadth_first_search(task, statistics, fingerprint_bits)
+        if search == 'pbfs':
+            if fingerprint_bits:
+                raise Exception('Parallel BFS does not support fingerprints')
+            return parallel_breadth_first_search(task, workers, statistics)
+        if search == 'ebfs':
+            return external_breadth_first_search(task, memory_budget, external_directory, statistics)
+        if heuristic not in HEURISTICS:
+            raise Exception('Heuristic ' + heuristic + ' not supported')
+        h = HEURISTICS[heuristic](task)
+        if search == 'wastar':
+            return weighted_astar_search(task, h, weight, statistics, fingerprint_bits)
+        return SEARCHES[search](task, h, statistics, fingerprint_bits)
 
     # -----------------------------------------------
     # Applicable
     # -----------------------------------------------
 
     def applicable(self, state, positive, negative):
-        return positive.issubset(state) and negative.isdisjoint(state)
+        return state.issuperset(positive) and state.isdisjoint(negative)
 
     # -----------------------------------------------
     # Apply
@@ -82,14 +186,41 @@ class Planner:
 # Main
 # -----------------------------------------------
 if __name__ == '__main__':
-    import sys, time
+    import argparse
     start_time = time.time()
-    domain = sys.argv[1]
-    problem = sys.argv[2]
-    verbose = len(sys.argv) > 3 and sys.argv[3] == '-v'
+    argparser = argparse.ArgumentParser(description='Solve a PDDL problem')
+    argparser.add_argument('domain')
+    argparser.add_argument('problem')
+    argparser.add_argument('-v', action='store_true', help='print full actions')
+    argparser.add_argument('-r', default='set', choices=sorted(REPRESENTATIONS), help='state representation')
+    argparser.add_argument('-f', action='store_true', help='exhaustive grounding')
+    argparser.add_argument('-g', type=int, metavar='N', help='worker processes of exhaustive grounding')
+    argparser.add_argument('-k', action='store_true', help='keep static atoms')
+    argparser.add_argument('-a', action='store_true', help='compact ground actions')
+    argparser.add_argument('-y', action='store_true', help='prune states symmetric by interchangeable objects')
+    argparser.add_argument('-o', action='store_true', help='prune successors outside strong stubborn sets')
+    argparser.add_argument('-c', metavar='DIR', help='cache directory')
+    argparser.add_argument('-p', action='store_true', help='print statistics')
+    argparser.add_argument('-s', default='bfs', choices=sorted(SEARCHES), help='search algorithm')
+    argparser.add_argument('-H', default='hff', choices=sorted(HEURISTICS), help='heuristic')
+    argparser.add_argument('-w', default=5, type=float, help='weighted A* weight')
+    argparser.add_argument('-j', type=int, help='worker processes of parallel BFS')
+    argparser.add_argument('-z', type=int, metavar='BITS', help='closed list of state hash fingerprints')
+    argparser.add_argument('-m', default=64, type=float, metavar='MB', help='memory budget of external BFS')
+    argparser.add_argument('-d', metavar='DIR', help='directory of external BFS files')
+    args = argparser.parse_args()
+    verbose = args.v
     planner = Planner()
-    plan = planner.solve(domain, problem)
+    plan = planner.solve(args.domain, args.problem, representation=args.r, reachable=not args.f, search=args.s, heuristic=args.H, weight=args.w, cache=args.c, simplify=not args.k, workers=args.j, fingerprint_bits=args.z, memory_budget=args.m, external_directory=args.d, ground_workers=args.g, compact=args.a, symmetry=args.y, stubborn=args.o)
     print('Time: ' + str(time.time() - start_time) + 's')
+    if args.p:
+        print(planner.statistics)
+        if args.z:
+            print('Fingerprint collision probability: ' + str(collision_probability(planner.statistics.peak_closed, args.z)))
+        if args.y:
+            print('Interchangeable objects: ' + str(planner.object_classes))
+        if args.o:
+            print('Successors pruned by stubborn sets: ' + str(planner.stubborn_pruned))
     if plan is not None:
         print('plan:')
         for act in plan:
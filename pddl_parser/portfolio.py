@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import copy, multiprocessing, time
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+from .PDDL import PDDL_Parser
+from .planner import Planner
+
+PORTFOLIO = [
+    {'search': 'bfs'},
+    {'search': 'gbfs', 'heuristic': 'hff'},
+    {'search': 'wastar', 'heuristic': 'hadd', 'weight': 5},
+    {'search': 'astar', 'heuristic': 'hmax'}
+]
+
+# -----------------------------------------------
+# Solve portfolio
+# -----------------------------------------------
+
+def solve_portfolio(domain, problem, configs=None, time_limit=None, best=False, **options):
+    # Each configuration overrides options and runs in its own process, the first valid plan
+    # is returned unless best, then the shortest valid plan found within time_limit,
+    # unsolvable results are final as every search is complete. Remaining processes are
+    # terminated and a report with status, time and plan length is returned for each configuration
+    configs = PORTFOLIO if configs is None else configs
+    parser = PDDL_Parser()
+    parser.parse_domain(domain)
+    checker = copy.deepcopy(parser)
+    checker.parse_problem(problem)
+    if 'cache' not in options:
+        domain = parser
+    start_time = time.time()
+    results = multiprocessing.Queue()
+    processes = []
+    report = []
+    for i, config in enumerate(configs):
+        config_options = dict(options)
+        config_options.update(config)
+        process = multiprocessing.Process(target=run, args=(i, domain, problem, config_options, results))
+        process.daemon = True
+        process.start()
+        processes.append(process)
+        report.append({'config': config, 'status': 'running', 'time': None, 'length': None})
+    plan = None
+    pending = len(configs)
+    try:
+        while pending:
+            timeout = 1.0
+            if time_limit is not None:
+                timeout = min(timeout, start_time + time_limit - time.time())
+                if timeout <= 0:
+                    break
+            try:
+                i, found, status, seconds = results.get(True, timeout)
+            except Empty:
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    break
+                continue
+            pending -= 1
+            report[i]['status'] = status
+            report[i]['time'] = seconds
+            if found is not None:
+                if not valid(checker, found):
+                    report[i]['status'] = 'invalid'
+                    continue
+                report[i]['length'] = len(found)
+                if plan is None or len(found) < len(plan):
+                    plan = found
+                if not best:
+                    break
+            elif status == 'unsolvable':
+                break
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        for entry in report:
+            if entry['status'] == 'running':
+                entry['status'] = 'cancelled'
+                entry['time'] = time.time() - start_time
+    return plan, report
+
+# -----------------------------------------------
+# Worker
+# -----------------------------------------------
+
+def run(index, domain, problem, options, results):
+    start_time = time.time()
+    try:
+        plan = Planner().solve(domain, problem, **options)
+        status = 'solved' if plan is not None else 'unsolvable'
+    except MemoryError:
+        plan, status = None, 'memout'
+    except Exception as e:
+        plan, status = None, 'error: ' + str(e)
+    results.put((index, plan, status, time.time() - start_time))
+
+# -----------------------------------------------
+# Valid
+# -----------------------------------------------
+
+def valid(parser, plan):
+    planner = Planner()
+    state = parser.state
+    for act in plan:
+        if not planner.applicable(state, act.positive_preconditions, act.negative_preconditions):
+            return False
+        state = planner.apply(state, act.add_effects, act.del_effects)
+    return planner.applicable(state, parser.positive_goals, parser.negative_goals)
+
+# -----------------------------------------------
+# Parse configuration
+# -----------------------------------------------
+
+def parse_config(text):
+    # search[:heuristic[:weight]]
+    parts = text.split(':')
+    config = {'search': parts[0]}
+    if len(parts) > 1:
+        config['heuristic'] = parts[1]
+    if len(parts) > 2:
+        config['weight'] = float(parts[2])
+    return config
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse, sys
+    argparser = argparse.ArgumentParser(description='Solve a PDDL problem with a portfolio of search configurations')
+    argparser.add_argument('domain')
+    argparser.add_argument('problem')
+    argparser.add_argument('-c', nargs='+', metavar='SEARCH[:HEURISTIC[:WEIGHT]]', help='configurations')
+    argparser.add_argument('-t', type=float, help='time limit in seconds')
+    argparser.add_argument('-b', action='store_true', help='wait for the shortest plan within the time limit')
+    argparser.add_argument('-r', default='set', help='state representation')
+    args = argparser.parse_args()
+    configs = [parse_config(text) for text in args.c] if args.c else None
+    plan, report = solve_portfolio(args.domain, args.problem, configs, args.t, args.b, representation=args.r)
+    for entry in report:
+        config = ':'.join([str(entry['config'][name]) for name in ['search', 'heuristic', 'weight'] if name in entry['config']])
+        time_taken = '' if entry['time'] is None else ' ' + str(entry['time']) + 's'
+        print(config + ': ' + entry['status'] + time_taken + ('' if entry['length'] is None else ' length ' + str(entry['length'])))
+    if plan is not None:
+        print('plan:')
+        for act in plan:
+            print(act.name + ' ' + ' '.join(act.parameters))
+    else:
+        sys.exit('No plan was found')
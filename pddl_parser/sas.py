@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+from .successor_generator import SuccessorGenerator
+
+# -----------------------------------------------
+# Synthesize invariants
+# -----------------------------------------------
+
+def synthesize_invariants(actions, state, max_size=3):
+    # Candidates are sets of (predicate, position) parts, atoms with the same object
+    # at the position of each part form one group, position None groups all atoms.
+    # Candidates that fail are refined with parts of atoms deleted by the failing action
+    fluents = set()
+    for act in actions:
+        fluents.update(act.add_effects)
+        fluents.update(act.del_effects)
+    arity = {}
+    for atom in fluents:
+        arity[atom[0]] = len(atom) - 1
+    queue = []
+    for pred in sorted(arity):
+        queue.append(frozenset([(pred, None)]))
+        for pos in range(arity[pred]):
+            queue.append(frozenset([(pred, pos)]))
+    seen = set(queue)
+    invariants = []
+    while queue:
+        candidate = queue.pop(0)
+        refinements = check_invariant(candidate, actions, state.intersection(fluents))
+        if refinements is True:
+            invariants.append(candidate)
+        elif refinements and len(candidate) < max_size:
+            for part in refinements:
+                new_candidate = candidate.union([part])
+                if new_candidate not in seen and len(set(pos is None for _, pos in new_candidate)) == 1:
+                    seen.add(new_candidate)
+                    queue.append(new_candidate)
+    return invariants
+
+def invariant_keys(candidate, atom):
+    keys = set()
+    for pred, pos in candidate:
+        if atom[0] == pred:
+            keys.add(None if pos is None else atom[pos + 1])
+    return keys
+
+def check_invariant(candidate, actions, state):
+    # True when no state reachable from state has two atoms of the same group,
+    # otherwise the parts that may balance the first unbalanced action
+    count = {}
+    for atom in state:
+        for key in invariant_keys(candidate, atom):
+            count[key] = count.get(key, 0) + 1
+            if count[key] > 1:
+                return None
+    for act in actions:
+        added = {}
+        for atom in act.add_effects:
+            if atom in act.positive_preconditions and atom not in act.del_effects:
+                continue
+            for key in invariant_keys(candidate, atom):
+                added.setdefault(key, set()).add(atom)
+        deleted = [atom for atom in act.del_effects if atom in act.positive_preconditions]
+        for key, atoms in added.items():
+            if len(atoms) > 1:
+                return None
+            balanced = False
+            for atom in deleted:
+                if key in invariant_keys(candidate, atom):
+                    balanced = True
+                    break
+            if not balanced:
+                refinements = []
+                for atom in sorted(deleted):
+                    if key is None:
+                        refinements.append((atom[0], None))
+                    else:
+                        for pos, term in enumerate(atom[1:]):
+                            if term == key:
+                                refinements.append((atom[0], pos))
+                return refinements
+    return True
+
+# -----------------------------------------------
+# Mutex groups
+# -----------------------------------------------
+
+def mutex_groups(actions, invariants):
+    # Ground groups of each invariant with the atoms actions change, invariants only
+    # hold for these, static atoms of the state are kept apart
+    atoms = set()
+    for act in actions:
+        atoms.update(act.add_effects)
+        atoms.update(act.del_effects)
+    groups = []
+    for candidate in invariants:
+        grouped = {}
+        for atom in atoms:
+            for key in invariant_keys(candidate, atom):
+                grouped.setdefault(key, set()).add(atom)
+        for key in sorted(grouped, key=str):
+            if len(grouped[key]) > 1:
+                groups.append(sorted(grouped[key]))
+    return groups
+
+
+class SASTask:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals, groups=None):
+        # Fluent atoms are covered by mutex groups, largest first, each group becomes a
+        # variable whose last value means no atom of the group holds, remaining atoms
+        # become binary variables. States are bytes with one value per variable
+        self.actions = actions
+        fluents = set()
+        for act in actions:
+            fluents.update(act.add_effects)
+            fluents.update(act.del_effects)
+        self.static = state.difference(fluents)
+        if groups is None:
+            groups = mutex_groups(actions, synthesize_invariants(actions, state))
+        self.mutex_groups = len(groups)
+        self.variables = []
+        self.atom_value = {}
+        covered = set()
+        groups = [list(group) for group in groups]
+        while groups:
+            groups.sort(key=lambda group: -len(group))
+            group = groups.pop(0)
+            if len(group) < 2:
+                break
+            self.add_variable(group)
+            covered.update(group)
+            groups = [[atom for atom in g if atom not in covered] for g in groups]
+        for atom in sorted(fluents.difference(covered)):
+            self.add_variable([atom])
+        # Values are read through bytearray, indexing bytes gives characters in Python 2
+        if max([len(values) for values in self.variables] or [0]) <= 256:
+            self.pack, self.unpack = bytes, bytearray
+        else:
+            self.pack, self.unpack = tuple, tuple
+        initial_state = [len(values) - 1 for values in self.variables]
+        for atom in state:
+            if atom in self.atom_value:
+                var, value = self.atom_value[atom]
+                initial_state[var] = value
+        self.initial_state = self.pack(self.unpack(initial_state))
+        self.positive_goals = positive_goals
+        self.solvable = positive_goals.difference(fluents).issubset(self.static) and self.static.isdisjoint(negative_goals)
+        self.goal_conditions = self.conditions(positive_goals, negative_goals)
+        # Actions with false static preconditions are never candidates
+        self.preconditions = []
+        self.effects = []
+        conditions = []
+        for act in actions:
+            static_positive = [atom for atom in act.positive_preconditions if atom not in fluents]
+            static_negative = [atom for atom in act.negative_preconditions if atom not in fluents]
+            if self.static.issuperset(static_positive) and self.static.isdisjoint(static_negative):
+                pre = self.conditions(act.positive_preconditions, act.negative_preconditions)
+            else:
+                pre = None
+            self.preconditions.append(pre)
+            self.effects.append(self.effect(act))
+            conditions.append([(var, value) for var, value, positive in pre if positive] if pre is not None else [None])
+        self.generator = SuccessorGenerator(actions, conditions)
+
+    def add_variable(self, atoms):
+        var = len(self.variables)
+        for value, atom in enumerate(atoms):
+            self.atom_value[atom] = (var, value)
+        self.variables.append(list(atoms) + [None])
+
+    def conditions(self, positive, negative):
+        conditions = []
+        for atom in positive:
+            if atom in self.atom_value:
+                conditions.append(self.atom_value[atom] + (True,))
+        for atom in negative:
+            if atom in self.atom_value:
+                conditions.append(self.atom_value[atom] + (False,))
+        return conditions
+
+    def effect(self, act):
+        # Deletes reset the variable only when the deleted atom holds, adds always win
+        assign = {}
+        reset = []
+        for atom in act.add_effects:
+            var, value = self.atom_value[atom]
+            assign[var] = value
+        for atom in act.del_effects:
+            var, value = self.atom_value[atom]
+            if var not in assign:
+                reset.append((var, value, len(self.variables[var]) - 1))
+        return sorted(assign.items()), reset
+
+    # -----------------------------------------------
+    # Goal reached
+    # -----------------------------------------------
+
+    def goal_reached(self, state):
+        return self.solvable and self.satisfied(self.unpack(state), self.goal_conditions)
+
+    def satisfied(self, state, conditions):
+        for var, value, positive in conditions:
+            if (state[var] == value) != positive:
+                return False
+        return True
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        values = self.unpack(state)
+        for i in self.generator.candidates(enumerate(values)):
+            pre = self.preconditions[i]
+            if pre is not None and self.satisfied(values, pre):
+                assign, reset = self.effects[i]
+                new_state = list(values)
+                for var, value, none in reset:
+                    if new_state[var] == value:
+                        new_state[var] = none
+                for var, value in assign:
+                    new_state[var] = value
+                yield i, self.pack(self.unpack(new_state))
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def decode(self, state):
+        atoms = set(self.static)
+        for var, value in enumerate(self.unpack(state)):
+            atom = self.variables[var][value]
+            if atom is not None:
+                atoms.add(atom)
+        return frozenset(atoms)
+
+    def goal_atoms(self):
+        return self.positive_goals
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import sys
+    from .PDDL import PDDL_Parser
+    from .grounding import ground
+    from .task import BitsetTask
+    parser = PDDL_Parser()
+    parser.parse_domain(sys.argv[1])
+    parser.parse_problem(sys.argv[2])
+    actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+    task = SASTask(actions, parser.state, parser.positive_goals, parser.negative_goals)
+    print('Mutex groups: ' + str(task.mutex_groups))
+    print('Variables: ' + str(len(task.variables)) + ' for ' + str(len(task.atom_value)) + ' fluent atoms')
+    for values in task.variables:
+        if len(values) > 2:
+            print('  ' + ' | '.join(['none' if atom is None else ' '.join(atom) for atom in values]))
+    frozenset_bytes = sys.getsizeof(parser.state) + sum([sys.getsizeof(atom) for atom in parser.state])
+    bitset_bytes = sys.getsizeof(BitsetTask(actions, parser.state, parser.positive_goals, parser.negative_goals).initial_state)
+    sas_bytes = sys.getsizeof(task.initial_state)
+    print('State bytes: frozenset ' + str(frozenset_bytes) + ', bitset ' + str(bitset_bytes) + ', sas ' + str(sas_bytes))
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import heapq, sys
+from array import array
+from collections import deque
+from .external import external_breadth_first_search
+from .parallel import parallel_breadth_first_search
+from .statistics import Statistics
+from .task import ZobristState
+
+INFINITY = float('inf')
+
+
+class NodeStore:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self):
+        # Node i is states[i], reached from node parents[i] with action actions[i]
+        self.states = []
+        self.parents = array('l')
+        self.actions = array('l')
+
+    def __len__(self):
+        return len(self.states)
+
+    # -----------------------------------------------
+    # Add
+    # -----------------------------------------------
+
+    def add(self, state, parent=-1, action=-1):
+        self.states.append(state)
+        self.parents.append(parent)
+        self.actions.append(action)
+        return len(self.states) - 1
+
+    # -----------------------------------------------
+    # Plan
+    # -----------------------------------------------
+
+    def plan(self, node):
+        plan = []
+        while self.parents[node] != -1:
+            plan.append(self.actions[node])
+            node = self.parents[node]
+        plan.reverse()
+        return plan
+
+    # -----------------------------------------------
+    # Memory
+    # -----------------------------------------------
+
+    def memory(self, *structures):
+        # Bytes used by nodes and the given open and closed structures, atoms shared with actions excluded
+        size = sys.getsizeof(self.states) + sys.getsizeof(self.parents) + sys.getsizeof(self.actions)
+        for state in self.states:
+            size += sys.getsizeof(state)
+        for structure in structures:
+            size += sys.getsizeof(structure)
+        return size
+
+# -----------------------------------------------
+# Breadth-first search
+# -----------------------------------------------
+
+def breadth_first_search(task, statistics=None, fingerprint_bits=None):
+    if getattr(task, 'batch_size', 1) > 1:
+        return batch_breadth_first_search(task, statistics, fingerprint_bits)
+    if statistics is None:
+        statistics = Statistics()
+    mask = fingerprint_mask(fingerprint_bits)
+    store = NodeStore()
+    state = task.initial_state
+    visited = set([fingerprint(state, mask)])
+    open_list = deque([store.add(state)])
+    try:
+        while open_list:
+            statistics.expanded += 1
+            statistics.progress(len(open_list))
+            node = open_list.popleft()
+            state = store.states[node]
+            if mask is not None:
+                store.states[node] = None
+            for i, new_state in task.successors(state):
+                statistics.generated += 1
+                key = fingerprint(new_state, mask)
+                if key not in visited:
+                    child = store.add(new_state, node, i)
+                    if task.goal_reached(new_state):
+                        return store.plan(child)
+                    visited.add(key)
+                    open_list.append(child)
+                else:
+                    statistics.duplicates += 1
+        return None
+    finally:
+        statistics.peak_closed = len(visited)
+        statistics.bytes_per_node = store.memory(visited, open_list) / float(len(store))
+
+def batch_breadth_first_search(task, statistics=None, fingerprint_bits=None):
+    if statistics is None:
+        statistics = Statistics()
+    mask = fingerprint_mask(fingerprint_bits)
+    # Up to batch_size open nodes are expanded with one successors_batch call,
+    # successors are visited in the same order as breadth-first search
+    batch_size = task.batch_size
+    store = NodeStore()
+    state = task.initial_state
+    visited = set([fingerprint(state, mask)])
+    open_list = deque([store.add(state)])
+    try:
+        while open_list:
+            nodes = [open_list.popleft() for _ in range(min(batch_size, len(open_list)))]
+            states = [store.states[node] for node in nodes]
+            if mask is not None:
+                for node in nodes:
+                    store.states[node] = None
+            for node, successors in zip(nodes, task.successors_batch(states)):
+                statistics.expanded += 1
+                statistics.progress(len(open_list))
+                for i, new_state in successors:
+                    statistics.generated += 1
+                    key = fingerprint(new_state, mask)
+                    if key not in visited:
+                        child = store.add(new_state, node, i)
+                        if task.goal_reached(new_state):
+                            return store.plan(child)
+                        visited.add(key)
+                        open_list.append(child)
+                    else:
+                        statistics.duplicates += 1
+        return None
+    finally:
+        statistics.peak_closed = len(visited)
+        statistics.bytes_per_node = store.memory(visited, open_list) / float(len(store))
+
+# -----------------------------------------------
+# Fingerprints
+# -----------------------------------------------
+
+def fingerprint_mask(bits):
+    # Closed lists keep only the low bits of state hashes and expanded states are
+    # released, a new state whose fingerprint was seen before is pruned as a duplicate
+    if bits is None:
+        return None
+    if not 1 <= bits <= 64:
+        raise Exception('Fingerprint bits must be between 1 and 64')
+    return (1 << bits) - 1
+
+def fingerprint(state, mask):
+    # Zobrist keys are masked directly, CPython folds 64-bit hashes modulo 2 ** 61 - 1
+    if mask is None:
+        return state
+    if isinstance(state, ZobristState):
+        return state.key & mask
+    return hash(state) & mask
+
+def collision_probability(states, bits):
+    # Birthday bound on any two of states distinct states sharing a fingerprint
+    return min(1.0, states * (states - 1) / 2.0 ** (bits + 1))
+
+# -----------------------------------------------
+# Best-first search
+# -----------------------------------------------
+
+def best_first_search(task, heuristic, g_weight=1, h_weight=1, statistics=None, fingerprint_bits=None):
+    # Open list ordered by g_weight * g + h_weight * h, ties broken by h and then FIFO,
+    # states are reopened when a cheaper path is found unless g is ignored
+    if statistics is None:
+        statistics = Statistics()
+    state = task.initial_state
+    h = heuristic(state)
+    if h == INFINITY:
+        return None
+    mask = fingerprint_mask(fingerprint_bits)
+    store = NodeStore()
+    g_values = array('l', [0])
+    h_values = array('d', [h])
+    best = {fingerprint(state, mask): store.add(state)}
+    open_list = [(h_weight * h, h, 0)]
+    try:
+        while open_list:
+            _, h, node = heapq.heappop(open_list)
+            state = store.states[node]
+            if best[fingerprint(state, mask)] != node:
+                continue
+            if mask is not None:
+                store.states[node] = None
+            statistics.expanded += 1
+            statistics.progress(len(open_list) + 1)
+            if task.goal_reached(state):
+                return store.plan(node)
+            new_g = g_values[node] + 1
+            for i, new_state in task.successors(state):
+                statistics.generated += 1
+                key = fingerprint(new_state, mask)
+                old = best.get(key)
+                if old is None:
+                    h = heuristic(new_state)
+                elif g_weight and new_g < g_values[old]:
+                    h = h_values[old]
+                else:
+                    statistics.duplicates += 1
+                    continue
+                child = best[key] = store.add(new_state, node, i)
+                g_values.append(new_g)
+                h_values.append(h)
+                if h != INFINITY:
+                    heapq.heappush(open_list, (g_weight * new_g + h_weight * h, h, child))
+        return None
+    finally:
+        statistics.peak_closed = len(best)
+        statistics.bytes_per_node = (store.memory(best, open_list) + sys.getsizeof(g_values) + sys.getsizeof(h_values)) / float(len(store))
+
+def greedy_best_first_search(task, heuristic, statistics=None, fingerprint_bits=None):
+    return best_first_search(task, heuristic, 0, 1, statistics, fingerprint_bits)
+
+def astar_search(task, heuristic, statistics=None, fingerprint_bits=None):
+    return best_first_search(task, heuristic, 1, 1, statistics, fingerprint_bits)
+
+def weighted_astar_search(task, heuristic, weight=5, statistics=None, fingerprint_bits=None):
+    return best_first_search(task, heuristic, 1, weight, statistics, fingerprint_bits)
+
+
+SEARCHES = {'bfs': breadth_first_search, 'pbfs': parallel_breadth_first_search, 'ebfs': external_breadth_first_search, 'gbfs': greedy_best_first_search, 'astar': astar_search, 'wastar': weighted_astar_search}
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import copy, json, multiprocessing, os, signal, socket, stat, threading, time
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+from .batch import TimeLimit, alarm
+from .cache import MemoryCache
+from .client import SOCKET
+from .grounding import ground
+from .PDDL import PDDL_Parser
+from .planner import Planner
+
+_cache = None
+_domains = None
+
+# -----------------------------------------------
+# Serve
+# -----------------------------------------------
+
+def serve(path=SOCKET, workers=None, max_entries=32):
+    # Connections are handled by threads that wait for the worker pool,
+    # each worker keeps its own parsed domains and ground tasks
+    # A socket left by a stopped server is replaced, a live server is not taken over
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(path)
+        except socket.error:
+            os.remove(path)
+        else:
+            raise Exception('Server already running on ' + path)
+        finally:
+            connection.close()
+    pool = multiprocessing.Pool(workers, initialize, (max_entries,))
+    server = Server(path, Handler)
+    server.pool = pool
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        pool.terminate()
+        pool.join()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+class Handler(socketserver.StreamRequestHandler):
+
+    # -----------------------------------------------
+    # Handle
+    # -----------------------------------------------
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                message = json.loads(line.decode())
+                command = message.get('command', 'solve')
+            except (ValueError, AttributeError):
+                message, command = None, 'invalid'
+            if command == 'solve':
+                response = self.server.pool.apply(solve_request, (message,))
+            elif command in ('ping', 'shutdown'):
+                response = {'status': 'ok'}
+            else:
+                response = {'status': 'error: invalid request'}
+            self.wfile.write((json.dumps(response) + '\n').encode())
+            self.wfile.flush()
+            if command == 'shutdown':
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+# -----------------------------------------------
+# Worker
+# -----------------------------------------------
+
+def initialize(max_entries):
+    global _cache, _domains
+    _cache = MemoryCache(max_entries)
+    _domains = MemoryCache(max_entries)
+
+def solve_request(message):
+    start_time = time.time()
+    time_limit = message.get('time_limit')
+    if time_limit:
+        signal.signal(signal.SIGALRM, alarm)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+    planner = Planner()
+    plan = None
+    cached = False
+    try:
+        domain = message['domain']
+        problem = message['problem']
+        options = dict((str(name), value) for name, value in message.get('options', {}).items())
+        # Ground tasks are stored under the key passed to the planner, missing ones start
+        # from a copy of the parsed domain
+        key = _cache.key([domain, problem], options.get('reachable', True))
+        cached = _cache.load(key) is not None
+        if not cached:
+            domain_key = _domains.key([domain])
+            parser = _domains.load(domain_key)
+            if parser is None:
+                parser = PDDL_Parser()
+                parser.parse_domain(domain)
+                _domains.store(domain_key, parser)
+            parser = copy.deepcopy(parser)
+            parser.parse_problem(problem)
+            _cache.store(key, (parser, ground(parser.actions, parser.state, parser.objects, parser.types, options.get('reachable', True))))
+        plan = planner.solve(domain, problem, cache=_cache, cache_key=key, **options)
+        status = 'solved' if plan is not None else 'unsolvable'
+    except TimeLimit:
+        status = 'timeout'
+    except MemoryError:
+        status = 'memout'
+    except Exception as e:
+        status = 'error: ' + str(e)
+    finally:
+        if time_limit:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    response = {'status': status, 'plan': None, 'time': time.time() - start_time, 'cached': cached}
+    if plan is not None:
+        response['plan'] = [[act.name] + list(act.parameters) for act in plan]
+    statistics = getattr(planner, 'statistics', None)
+    if statistics is not None:
+        response['statistics'] = {'times': statistics.times, 'ground_actions': statistics.ground_actions,
+                                  'expanded': statistics.expanded, 'generated': statistics.generated}
+    return response
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import argparse
+    argparser = argparse.ArgumentParser(description='Serve PDDL solve requests over a Unix socket')
+    argparser.add_argument('-S', default=SOCKET, metavar='PATH', help='server socket')
+    argparser.add_argument('-j', type=int, help='number of worker processes')
+    argparser.add_argument('-n', default=32, type=int, help='ground tasks kept per worker')
+    args = argparser.parse_args()
+    print('Serving on ' + args.S)
+    serve(args.S, args.j, args.n)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import copy
+
+# -----------------------------------------------
+# Simplify
+# -----------------------------------------------
+
+def simplify(actions, state, positive_goals, negative_goals):
+    # Atoms outside every effect keep their initial value, they are removed from states,
+    # actions and goals. Returns None when a static goal is false, otherwise the reduced
+    # actions, the index of the original action of each one, state and goals
+    fluents = set()
+    for act in actions:
+        fluents.update(act.add_effects)
+        fluents.update(act.del_effects)
+    static_state = state.difference(fluents)
+    if not positive_goals.difference(fluents).issubset(static_state) or not negative_goals.isdisjoint(static_state):
+        return None
+    reduced = []
+    origin = []
+    for i, act in enumerate(actions):
+        static_positive = [atom for atom in act.positive_preconditions if atom not in fluents]
+        static_negative = [atom for atom in act.negative_preconditions if atom not in fluents]
+        if not static_state.issuperset(static_positive) or not static_state.isdisjoint(static_negative):
+            continue
+        if static_positive or static_negative:
+            # Keep the container type, frozensets or the tuples of compact actions
+            act = copy.copy(act)
+            act.positive_preconditions = type(act.positive_preconditions)([atom for atom in act.positive_preconditions if atom in fluents])
+            act.negative_preconditions = type(act.negative_preconditions)([atom for atom in act.negative_preconditions if atom in fluents])
+        reduced.append(act)
+        origin.append(i)
+    return (reduced, origin, state.intersection(fluents),
+            positive_goals.intersection(fluents), negative_goals.intersection(fluents))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import time
+from contextlib import contextmanager
+
+PHASES = ['tokenize', 'parse', 'ground', 'search']
+
+
+class Statistics:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, hooks=(), interval=10000):
+        # Hooks are called as hook(event, statistics) after each phase and
+        # every interval expansions, nothing is called without hooks
+        self.hooks = list(hooks)
+        self.interval = interval
+        self.times = dict((phase, 0.0) for phase in PHASES)
+        self.ground_actions = 0
+        self.expanded = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.peak_open = 0
+        self.peak_closed = 0
+        self.bytes_per_node = 0.0
+        self.state_bytes = 0
+
+    # -----------------------------------------------
+    # Phase
+    # -----------------------------------------------
+
+    @contextmanager
+    def phase(self, name):
+        start_time = time.time()
+        try:
+            yield self
+        finally:
+            self.record(name, time.time() - start_time)
+
+    def record(self, name, seconds):
+        self.times[name] = self.times.get(name, 0.0) + seconds
+        self.notify(name)
+
+    # -----------------------------------------------
+    # Notify
+    # -----------------------------------------------
+
+    def notify(self, event):
+        for hook in self.hooks:
+            hook(event, self)
+
+    def progress(self, open_size):
+        # Called once per expansion by search
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+        if self.hooks and not self.expanded % self.interval:
+            self.notify('progress')
+
+    # -----------------------------------------------
+    # Nodes per second
+    # -----------------------------------------------
+
+    def nodes_per_second(self):
+        if self.times['search']:
+            return self.generated / self.times['search']
+        return 0.0
+
+    # -----------------------------------------------
+    # to String
+    # -----------------------------------------------
+
+    def __str__(self):
+        phases = PHASES + sorted([phase for phase in self.times if phase not in PHASES])
+        return 'Phases: ' + ', '.join([phase + ' ' + '%.6fs' % self.times[phase] for phase in phases]) + \
+               '\nGround actions: ' + str(self.ground_actions) + \
+               '\nExpanded: ' + str(self.expanded) + ', generated: ' + str(self.generated) + ', duplicates: ' + str(self.duplicates) + \
+               '\nPeak open: ' + str(self.peak_open) + ', peak closed: ' + str(self.peak_closed) + \
+               '\nBytes per node: ' + str(int(self.bytes_per_node)) + ', initial state: ' + str(self.state_bytes) + \
+               '\nNodes per second: ' + str(int(self.nodes_per_second()))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+
+class StubbornTask:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, task, positive_goals, negative_goals, min_pruning_ratio=0.2, check_after=1000):
+        # Successors of task restricted to the applicable actions of a strong stubborn set,
+        # a literal (atom, True) holds when atom is in the state and (atom, False) when it is not.
+        # Pruning stops after check_after expansions when less than min_pruning_ratio of the
+        # applicable actions were pruned, its cost is not paid in tightly coupled tasks
+        self.task = task
+        self.min_pruning_ratio = min_pruning_ratio
+        self.check_after = check_after
+        self.enabled = True
+        self.expanded = 0
+        self.applicable = 0
+        self.actions = actions = task.actions
+        self.initial_state = task.initial_state
+        self.achievers = achievers = {}
+        self.adders = adders = {}
+        self.deleters = deleters = {}
+        self.requirers = requirers = {}
+        self.forbidders = forbidders = {}
+        for i, act in enumerate(actions):
+            for atom in act.add_effects:
+                adders.setdefault(atom, []).append(i)
+            for atom in act.del_effects:
+                deleters.setdefault(atom, []).append(i)
+            for atom in act.positive_preconditions:
+                requirers.setdefault(atom, []).append(i)
+            for atom in act.negative_preconditions:
+                forbidders.setdefault(atom, []).append(i)
+        for atom, ids in adders.items():
+            achievers[(atom, True)] = frozenset(ids)
+        for atom, ids in deleters.items():
+            achievers[(atom, False)] = frozenset(ids)
+        # Literals in order of fewest achievers, the first false one gives the smallest enabling set
+        def literals(positive, negative):
+            group = [(atom, True) for atom in positive] + [(atom, False) for atom in negative]
+            return sorted(group, key=lambda literal: (len(achievers.get(literal, ())), literal))
+        self.goal_literals = literals(positive_goals, negative_goals)
+        self.preconditions = [literals(act.positive_preconditions, act.negative_preconditions) for act in actions]
+        self.interference = {}
+        self.pruned = 0
+
+    # -----------------------------------------------
+    # Interfering
+    # -----------------------------------------------
+
+    def interfering(self, i):
+        # Actions that i disables, that disable i or whose effects conflict with those of i
+        ids = self.interference.get(i)
+        if ids is None:
+            act = self.actions[i]
+            ids = set()
+            for atom in act.del_effects:
+                ids.update(self.requirers.get(atom, ()))
+                ids.update(self.adders.get(atom, ()))
+            for atom in act.add_effects:
+                ids.update(self.forbidders.get(atom, ()))
+                ids.update(self.deleters.get(atom, ()))
+            for atom in act.positive_preconditions:
+                ids.update(self.deleters.get(atom, ()))
+            for atom in act.negative_preconditions:
+                ids.update(self.adders.get(atom, ()))
+            ids.discard(i)
+            ids = self.interference[i] = frozenset(ids)
+        return ids
+
+    # -----------------------------------------------
+    # Stubborn set
+    # -----------------------------------------------
+
+    def stubborn_set(self, atoms, applicable):
+        # Achievers of a false goal literal, closed under interference for applicable actions
+        # and under achievers of a false precondition for the others. None in goal states and
+        # as soon as every applicable action is in the set, nothing would be pruned
+        goal = self.false_literal(self.goal_literals, atoms)
+        if goal is None:
+            return None
+        achievers = self.achievers
+        stubborn = set(achievers.get(goal, ()))
+        outside = applicable.difference(stubborn)
+        queue = list(stubborn)
+        while queue and outside:
+            i = queue.pop()
+            literal = self.false_literal(self.preconditions[i], atoms)
+            new = (self.interfering(i) if literal is None else achievers.get(literal, frozenset())).difference(stubborn)
+            stubborn.update(new)
+            outside.difference_update(new)
+            queue.extend(new)
+        return stubborn if outside else None
+
+    def false_literal(self, literals, atoms):
+        for literal in literals:
+            if (literal[0] in atoms) != literal[1]:
+                return literal
+        return None
+
+    # -----------------------------------------------
+    # Goal reached
+    # -----------------------------------------------
+
+    def goal_reached(self, state):
+        return self.task.goal_reached(state)
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        if not self.enabled:
+            for successor in self.task.successors(state):
+                yield successor
+            return
+        self.expanded += 1
+        if self.expanded == self.check_after and self.pruned < self.min_pruning_ratio * self.applicable:
+            self.enabled = False
+        successors = list(self.task.successors(state))
+        self.applicable += len(successors)
+        stubborn = self.stubborn_set(self.task.decode(state), set([i for i, _ in successors]))
+        for i, new_state in successors:
+            if stubborn is None or i in stubborn:
+                yield i, new_state
+            else:
+                self.pruned += 1
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def decode(self, state):
+        return self.task.decode(state)
+
+    def goal_atoms(self):
+        return self.task.goal_atoms()
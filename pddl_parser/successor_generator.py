@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+class SuccessorGenerator:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, preconditions=None):
+        if preconditions is None:
+            preconditions = [act.positive_preconditions for act in actions]
+        self.actions = actions
+        # Index each action by its least shared positive precondition,
+        # actions without positive preconditions are always candidates
+        frequency = {}
+        for pre in preconditions:
+            for atom in pre:
+                frequency[atom] = frequency.get(atom, 0) + 1
+        self.index = {}
+        self.unconditional = []
+        for i, pre in enumerate(preconditions):
+            if pre:
+                key = min(pre, key=lambda atom: (frequency[atom], atom))
+                self.index.setdefault(key, []).append(i)
+            else:
+                self.unconditional.append(i)
+
+    # -----------------------------------------------
+    # Candidates
+    # -----------------------------------------------
+
+    def candidates(self, atoms):
+        # Indices of actions whose key atom holds, in grounding order
+        ids = list(self.unconditional)
+        index = self.index
+        for atom in atoms:
+            bucket = index.get(atom)
+            if bucket:
+                ids += bucket
+        ids.sort()
+        return ids
+
+    # -----------------------------------------------
+    # Applicable
+    # -----------------------------------------------
+
+    def applicable(self, state):
+        actions = self.actions
+        return [i for i in self.candidates(state) if state.issuperset(actions[i].positive_preconditions) and state.isdisjoint(actions[i].negative_preconditions)]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+from .task import Task
+
+
+# -----------------------------------------------
+# Object classes
+# -----------------------------------------------
+
+def object_classes(schemas, objects, types, state, positive_goals, negative_goals):
+    # Objects of the same types, not named by any schema, whose swap maps the initial
+    # state and goals to themselves; swaps compose, so each class is interchangeable
+    constants = set()
+    for action in schemas:
+        variables = set([var for var, _ in action.parameters])
+        for group in (action.positive_preconditions, action.negative_preconditions, action.add_effects, action.del_effects):
+            for pred in group:
+                constants.update([t for t in pred[1:] if t not in variables])
+    direct_types = {}
+    for t, items in objects.items():
+        for obj in items:
+            direct_types.setdefault(obj, set()).add(t)
+    occurrences = {}
+    for k, atoms in enumerate((state, positive_goals, negative_goals)):
+        for atom in atoms:
+            for t in atom[1:]:
+                occurrences.setdefault(t, []).append((k, atom))
+    # Only objects with the same types and occurrence profile may be swapped
+    buckets = {}
+    for obj in sorted(direct_types):
+        if obj in constants:
+            continue
+        profile = sorted([(k, atom[0], atom.index(obj, 1)) for k, atom in occurrences.get(obj, ())])
+        buckets.setdefault((tuple(sorted(direct_types[obj])), tuple(profile)), []).append(obj)
+    sets = (state, positive_goals, negative_goals)
+    classes = []
+    for _, items in sorted(buckets.items()):
+        # An object swappable with the first member of a class is swappable with all of them
+        bucket_classes = []
+        for obj in items:
+            for cls in bucket_classes:
+                if swappable(cls[0], obj, occurrences, sets):
+                    cls.append(obj)
+                    break
+            else:
+                bucket_classes.append([obj])
+        classes += [cls for cls in bucket_classes if len(cls) > 1]
+    return classes
+
+def swappable(a, b, occurrences, sets):
+    mapping = {a: b, b: a}
+    for k, atom in occurrences.get(a, []) + occurrences.get(b, []):
+        if atom[:1] + tuple([mapping.get(t, t) for t in atom[1:]]) not in sets[k]:
+            return False
+    return True
+
+
+class CanonicalState(frozenset):
+
+    # Frozenset of atoms compared and hashed by its canonical image
+    __slots__ = ('key',)
+
+    def __new__(cls, atoms, key):
+        self = frozenset.__new__(cls, atoms)
+        self.key = key
+        return self
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __ne__(self, other):
+        return self.key != other.key
+
+    def __reduce__(self):
+        return (CanonicalState, (tuple(self), self.key))
+
+
+class SymmetryTask(Task):
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals, classes):
+        # Real states are expanded, visited lists see them through their canonical image
+        Task.__init__(self, actions, state, positive_goals, negative_goals)
+        self.classes = classes
+        self.class_of = dict((obj, '?' + str(k)) for k, cls in enumerate(classes) for obj in cls)
+        self.initial_state = CanonicalState(state, self.canonical(state))
+
+    # -----------------------------------------------
+    # Canonical
+    # -----------------------------------------------
+
+    def canonical(self, state):
+        # Image of state under the permutation sorting the objects of each class by the atoms
+        # they occur in, any image is a symmetric state so equal images are never a false merge
+        class_of = self.class_of
+        signatures = {}
+        for atom in state:
+            for t in atom[1:]:
+                if t in class_of:
+                    signatures.setdefault(t, []).append(atom[:1] + tuple(['*' if u == t else class_of.get(u, u) for u in atom[1:]]))
+        mapping = {}
+        for cls in self.classes:
+            order = sorted(cls, key=lambda obj: sorted(signatures.get(obj, ())))
+            for obj, image in zip(order, cls):
+                if obj != image:
+                    mapping[obj] = image
+        if not mapping:
+            # Set operations of Python 2 return the subclass, without a key
+            return frozenset(state)
+        return frozenset([atom[:1] + tuple([mapping.get(t, t) for t in atom[1:]]) for atom in state])
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        canonical = self.canonical
+        for i, new_state in Task.successors(self, state):
+            yield i, CanonicalState(new_state, canonical(new_state))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import random
+from .bitset import AtomTable
+from .successor_generator import SuccessorGenerator
+
+
+class Task:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals):
+        self.actions = actions
+        self.initial_state = state
+        self.positive_goals = positive_goals
+        self.negative_goals = negative_goals
+        self.generator = SuccessorGenerator(actions)
+
+    # -----------------------------------------------
+    # Goal reached
+    # -----------------------------------------------
+
+    def goal_reached(self, state):
+        return self.positive_goals.issubset(state) and self.negative_goals.isdisjoint(state)
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        actions = self.actions
+        for i in self.generator.applicable(state):
+            act = actions[i]
+            yield i, state.difference(act.del_effects).union(act.add_effects)
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def decode(self, state):
+        return state
+
+    def goal_atoms(self):
+        return self.positive_goals
+
+
+class BitsetTask(Task):
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals):
+        self.actions = actions
+        self.table = table = AtomTable(state)
+        self.masks = [act.encode(table) for act in actions]
+        self.initial_state = table.encode(state)
+        self.positive_goals = table.encode(positive_goals)
+        self.negative_goals = table.encode(negative_goals)
+        ids = table.ids
+        self.generator = SuccessorGenerator(actions, [[ids[atom] for atom in act.positive_preconditions] for act in actions])
+
+    # -----------------------------------------------
+    # Goal reached
+    # -----------------------------------------------
+
+    def goal_reached(self, state):
+        return state & self.positive_goals == self.positive_goals and not state & self.negative_goals
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        masks = self.masks
+        for i in self.generator.candidates(self.table.indices(state)):
+            positive, negative, add, delete = masks[i]
+            if state & positive == positive and not state & negative:
+                yield i, (state & ~delete) | add
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def decode(self, state):
+        return self.table.decode(state)
+
+    def goal_atoms(self):
+        return self.table.decode(self.positive_goals)
+
+
+class ZobristState(frozenset):
+
+    # Frozenset of atoms with an incrementally kept key, hashed as a frozenset in C,
+    # the key is used for fingerprints and partitions
+    __slots__ = ('key',)
+
+    def __new__(cls, atoms, key):
+        self = frozenset.__new__(cls, atoms)
+        self.key = key
+        return self
+
+    def __reduce__(self):
+        return (ZobristState, (tuple(self), self.key))
+
+
+class ZobristTask(Task):
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals, seed=0):
+        # Each atom has a random 64-bit key, a state key is the XOR of the keys of its
+        # atoms and is updated with the atoms each action really adds or deletes
+        Task.__init__(self, actions, state, positive_goals, negative_goals)
+        rng = random.Random(seed)
+        self.keys = keys = {}
+        for atom in sorted(state):
+            keys[atom] = rng.getrandbits(64)
+        for act in actions:
+            for atom in sorted(set(act.add_effects).union(act.del_effects)):
+                if atom not in keys:
+                    keys[atom] = rng.getrandbits(64)
+        key = 0
+        for atom in state:
+            key ^= keys[atom]
+        self.initial_state = ZobristState(state, key)
+        self.effects = [(tuple(act.add_effects), tuple([atom for atom in act.del_effects if atom not in act.add_effects])) for act in actions]
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        # Atoms and key are changed in one pass, the state is built from an iterator
+        # as copying a set sizes the table for twice its atoms
+        effects = self.effects
+        keys = self.keys
+        new = frozenset.__new__
+        for i in self.generator.applicable(state):
+            add, delete = effects[i]
+            key = state.key
+            atoms = set(state)
+            for atom in add:
+                if atom not in state:
+                    key ^= keys[atom]
+                    atoms.add(atom)
+            for atom in delete:
+                if atom in state:
+                    key ^= keys[atom]
+                    atoms.remove(atom)
+            new_state = new(ZobristState, iter(atoms))
+            new_state.key = key
+            yield i, new_state
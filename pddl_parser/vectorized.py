@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# Four spaces as indentation [no tabs]
+
+# This file is part of PDDL Parser, available at <https://github.com/pucrs-automated-planning/pddl-parser>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from .bitset import AtomTable
+from .task import BitsetTask
+
+
+class NumpyTask:
+
+    # -----------------------------------------------
+    # Initialize
+    # -----------------------------------------------
+
+    def __init__(self, actions, state, positive_goals, negative_goals, batch_size=256):
+        # Ground actions as boolean matrices over interned atoms, a state is the packed bytes
+        # of its atom vector, batches of states are checked against all actions at once
+        if numpy is None:
+            raise Exception('NumPy backend requires numpy')
+        self.actions = actions
+        self.table = table = AtomTable(state)
+        for act in actions:
+            for group in (act.positive_preconditions, act.add_effects):
+                for atom in group:
+                    table.intern(atom)
+        for atom in positive_goals:
+            table.intern(atom)
+        self.size = len(table)
+        self.width = (self.size + 7) // 8
+        # Precondition matrices are float32 so applicability is two BLAS products,
+        # effect matrices have one row per action
+        self.positive = self.matrix([act.positive_preconditions for act in actions]).T.astype(numpy.float32)
+        self.negative = self.matrix([act.negative_preconditions for act in actions]).T.astype(numpy.float32)
+        self.add = self.matrix([act.add_effects for act in actions])
+        self.delete = self.matrix([act.del_effects for act in actions])
+        self.initial_state = self.pack(self.matrix([state]))[0]
+        self.positive_goals = positive_goals
+        self.negative_goals = negative_goals
+        self.goal_positive = numpy.frombuffer(self.pack(self.matrix([positive_goals]))[0], numpy.uint8)
+        self.goal_negative = numpy.frombuffer(self.pack(self.matrix([negative_goals]))[0], numpy.uint8)
+        # Large action sets get smaller batches to bound the states by actions matrix
+        self.batch_size = max(1, min(batch_size, (1 << 22) // max(1, len(actions))))
+
+    def matrix(self, groups):
+        # Negative conditions on atoms outside the table always hold
+        rows = numpy.zeros((len(groups), self.size), bool)
+        ids = self.table.ids
+        for k, group in enumerate(groups):
+            for atom in group:
+                if atom in ids:
+                    rows[k, ids[atom]] = True
+        return rows
+
+    # -----------------------------------------------
+    # Pack
+    # -----------------------------------------------
+
+    def pack(self, rows):
+        data = numpy.packbits(rows, axis=1).tobytes()
+        width = self.width
+        return [data[k * width:(k + 1) * width] for k in range(len(rows))]
+
+    def unpack(self, states):
+        data = numpy.frombuffer(b''.join(states), numpy.uint8).reshape(len(states), self.width)
+        return numpy.unpackbits(data, axis=1)[:, :self.size].astype(bool)
+
+    # -----------------------------------------------
+    # Goal reached
+    # -----------------------------------------------
+
+    def goal_reached(self, state):
+        values = numpy.frombuffer(state, numpy.uint8)
+        return numpy.array_equal(values & self.goal_positive, self.goal_positive) and not (values & self.goal_negative).any()
+
+    # -----------------------------------------------
+    # Successors
+    # -----------------------------------------------
+
+    def successors(self, state):
+        return iter(self.successors_batch([state])[0])
+
+    def successors_batch(self, states):
+        # An action is applicable when it misses no positive and meets no negative precondition,
+        # successors of each state are listed in grounding order
+        rows = self.unpack(states)
+        values = rows.astype(numpy.float32)
+        applicable = (numpy.dot(1 - values, self.positive) == 0) & (numpy.dot(values, self.negative) == 0)
+        parents, indices = numpy.nonzero(applicable)
+        new_states = self.pack((rows[parents] & ~self.delete[indices]) | self.add[indices])
+        successors = [[] for _ in states]
+        for parent, i, new_state in zip(parents.tolist(), indices.tolist(), new_states):
+            successors[parent].append((i, new_state))
+        return successors
+
+    # -----------------------------------------------
+    # Decode
+    # -----------------------------------------------
+
+    def decode(self, state):
+        atoms = self.table.atoms
+        return frozenset([atoms[i] for i in numpy.flatnonzero(self.unpack([state])[0]).tolist()])
+
+    def goal_atoms(self):
+        return self.positive_goals
+
+# -----------------------------------------------
+# NumPy task
+# -----------------------------------------------
+
+def numpy_task(actions, state, positive_goals, negative_goals):
+    # Pure Python bitsets expanded one state at a time when NumPy is not installed
+    if numpy is None:
+        return BitsetTask(actions, state, positive_goals, negative_goals)
+    return NumpyTask(actions, state, positive_goals, negative_goals)
+
+
+# -----------------------------------------------
+# Main
+# -----------------------------------------------
+if __name__ == '__main__':
+    import sys, time
+    from .PDDL import PDDL_Parser
+    from .grounding import ground
+    from .task import Task
+    # Successors of a BFS layer with sets one state at a time and with NumPy batches
+    domain, problem = sys.argv[1], sys.argv[2]
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    parser = PDDL_Parser()
+    parser.parse_domain(domain)
+    parser.parse_problem(problem)
+    actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+    set_task = Task(actions, parser.state, parser.positive_goals, parser.negative_goals)
+    task = NumpyTask(actions, parser.state, parser.positive_goals, parser.negative_goals)
+    layer = [parser.state]
+    visited = set(layer)
+    while len(layer) < size:
+        new_layer = []
+        for state in layer:
+            for _, new_state in set_task.successors(state):
+                if new_state not in visited:
+                    visited.add(new_state)
+                    new_layer.append(new_state)
+        if not new_layer:
+            break
+        layer = new_layer
+    print('Layer: ' + str(len(layer)) + ' states, ' + str(len(actions)) + ' actions, ' + str(task.size) + ' atoms')
+    start_time = time.time()
+    count = sum(len(list(set_task.successors(state))) for state in layer)
+    print('set: ' + str(count) + ' successors, ' + str(time.time() - start_time) + 's')
+    states = task.pack(task.matrix(layer))
+    start_time = time.time()
+    count = 0
+    for k in range(0, len(states), task.batch_size):
+        count += sum(len(successors) for successors in task.successors_batch(states[k:k + task.batch_size]))
+    print('numpy: ' + str(count) + ' successors, ' + str(time.time() - start_time) + 's')
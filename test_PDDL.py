@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
-import unittest
+import copy, os, shutil, tempfile, unittest
 from pddl_parser.action import Action
 from pddl_parser.PDDL import PDDL_Parser
 
@@ -56,6 +56,29 @@ class Test_PDDL(unittest.TestCase):
             [':goal', ['and', ['dinner'], ['present'], ['not', ['garbage']]]]]
         )
 
+    def test_iter_tokens_chunks(self):
+        parser = PDDL_Parser()
+        tokens = list(parser.iter_tokens('examples/dwr/pb1.pddl'))
+        self.assertEqual(list(parser.iter_tokens('examples/dwr/pb1.pddl', 7)), tokens)
+        self.assertEqual(tokens[:6], ['(', 'define', '(', 'problem', 'pb1', ')'])
+        self.assertNotIn('task', tokens)
+
+    def test_iter_tokens_long_lines(self):
+        # Lines longer than a chunk, with a comment longer than a chunk
+        parser = PDDL_Parser()
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'line.pddl')
+            with open(filename, 'w') as f:
+                f.write('(define (problem line)' + ' (clear block)' * 50 + ' ; ' + 'comment ' * 20 + '\n(:goal (on a b)) ;end')
+            tokens = list(parser.iter_tokens(filename))
+            self.assertEqual(tokens.count('block'), 50)
+            self.assertNotIn('comment', tokens)
+            for chunk_size in [1, 5, 16, 64]:
+                self.assertEqual(list(parser.iter_tokens(filename, chunk_size)), tokens)
+        finally:
+            shutil.rmtree(directory)
+
     # -----------------------------------------------
     # Test parse domain
     # -----------------------------------------------
@@ -82,6 +105,21 @@ class Test_PDDL(unittest.TestCase):
         parser = PDDL_Parser()
         self.assertRaises(Exception, parser.parse_domain, 'examples/dinner/dinner.pddl', [])
 
+    def test_parse_does_not_modify_tokens(self):
+        parser = PDDL_Parser()
+        parser.predicates = {}
+        parser.types = {}
+        parser.actions = []
+        tokens = parser.scan_tokens('examples/dwr/dwr.pddl')
+        original = copy.deepcopy(tokens)
+        parser.parse_types(tokens[3][1:])
+        parser.parse_predicates(tokens[4][1:])
+        for group in tokens[5:]:
+            parser.parse_action(group[1:])
+        self.assertEqual(tokens, original)
+        self.assertEqual(parser.predicates['at'], {'?r': 'robot', '?l': 'location'})
+        self.assertEqual(parser.actions[0].parameters, (['?r', 'robot'], ['?from', 'location'], ['?to', 'location']))
+
     # -----------------------------------------------
     # Test parse problem
     # -----------------------------------------------
@@ -98,6 +136,15 @@ class Test_PDDL(unittest.TestCase):
         self.assertEqual(parser.positive_goals, frozenset_of_tuples([['dinner'], ['present']]))
         self.assertEqual(parser.negative_goals, frozenset_of_tuples([['garbage']]))
 
+    def test_parse_problem_init(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        self.assertEqual(len(parser.state), 36)
+        self.assertIn(('on', 'cc', 'cb'), parser.state)
+        self.assertRaises(Exception, list, parser.scan_facts(iter(['(', 'on', '(', 'a', ')', ')'])))
+        self.assertRaises(Exception, list, parser.scan_facts(iter(['(', 'on', 'a', ')'])))
+
     # -----------------------------------------------
     # Test parse predicates
     # -----------------------------------------------
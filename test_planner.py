@@ -16,9 +16,27 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
-import unittest
-from pddl_parser.action import Action
+import itertools, os, shutil, socket, subprocess, sys, tempfile, threading, time, unittest
+from pddl_parser.action import Action, ActionTemplate, GroundAction, compact
 from pddl_parser.planner import Planner
+from pddl_parser.PDDL import PDDL_Parser
+from pddl_parser.successor_generator import SuccessorGenerator
+from pddl_parser.batch import problem_files, solve_batch
+from pddl_parser.bitset import AtomTable
+from pddl_parser import client
+from pddl_parser.cache import Cache, MemoryCache
+from pddl_parser.server import serve
+from pddl_parser.stubborn import StubbornTask
+from pddl_parser.symmetry import CanonicalState, SymmetryTask, object_classes
+from pddl_parser import vectorized
+from pddl_parser.grounding import assignments, ground, ground_parallel, static_predicates
+from pddl_parser.heuristic import HMax, HAdd, HFF
+from pddl_parser.lazy import LazyTask
+from pddl_parser.sas import SASTask, mutex_groups, synthesize_invariants
+from pddl_parser.search import NodeStore, collision_probability, fingerprint
+from pddl_parser.simplify import simplify
+from pddl_parser.statistics import Statistics
+from pddl_parser.task import BitsetTask, Task, ZobristState, ZobristTask
 
 class Test_Planner(unittest.TestCase):
 
@@ -36,6 +54,533 @@ class Test_Planner(unittest.TestCase):
             ]
         )
 
+    def test_solve_bitset(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            self.assertEqual(planner.solve(domain, problem, representation='bitset'), planner.solve(domain, problem))
+
+    def test_solve_sas(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            self.assertEqual(planner.solve(domain, problem, representation='sas'), planner.solve(domain, problem))
+            self.assertEqual(planner.solve(domain, problem, representation='sas', simplify=False), planner.solve(domain, problem))
+        self.assertEqual(len(planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', representation='sas', search='astar', heuristic='hmax')), 17)
+
+    def test_solve_compact(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            expected = [(act.name, act.parameters) for act in planner.solve(domain, problem)]
+            for representation in ['set', 'bitset', 'sas', 'zobrist']:
+                plan = planner.solve(domain, problem, representation=representation, compact=True)
+                self.assertTrue(all(type(act) is GroundAction for act in plan))
+                self.assertEqual([(act.name, act.parameters) for act in plan], expected)
+
+    @unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed')
+    def test_solve_numpy(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            plan = planner.solve(domain, problem)
+            self.assertEqual(planner.solve(domain, problem, representation='numpy'), plan)
+            self.assertEqual(planner.solve(domain, problem, representation='numpy', simplify=False), plan)
+            self.assertEqual(len(planner.solve(domain, problem, representation='numpy', search='astar', heuristic='hmax')), len(plan))
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+        task = vectorized.NumpyTask(actions, parser.state, parser.positive_goals, parser.negative_goals)
+        set_task = Task(actions, parser.state, parser.positive_goals, parser.negative_goals)
+        states = [new_state for _, new_state in set_task.successors(parser.state)] + [parser.state]
+        batch = task.successors_batch(task.pack(task.matrix(states)))
+        for state, successors in zip(states, batch):
+            self.assertEqual([(i, task.decode(new_state)) for i, new_state in successors], list(set_task.successors(state)))
+        self.assertEqual(task.decode(task.initial_state), parser.state)
+
+    def test_numpy_fallback(self):
+        numpy = vectorized.numpy
+        vectorized.numpy = None
+        try:
+            self.assertIsInstance(vectorized.numpy_task([], frozenset(), frozenset(), frozenset()), BitsetTask)
+            self.assertEqual(Planner().solve('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl', representation='numpy'),
+                             Planner().solve('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'))
+        finally:
+            vectorized.numpy = numpy
+
+    def test_solve_symmetry(self):
+        planner = Planner()
+        self.assertEqual(planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', symmetry=True), planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl'))
+        self.assertEqual(planner.object_classes, [])
+        directory = tempfile.mkdtemp()
+        try:
+            problem = os.path.join(directory, 'table.pddl')
+            with open(problem, 'w') as f:
+                f.write('(define (problem table) (:domain blocksworld) (:objects a b c d e f)\n')
+                f.write('  (:init (clear a) (clear b) (clear c) (clear d) (clear e) (clear f) (ontable a) (ontable b) (ontable c) (ontable d) (ontable e) (ontable f))\n')
+                f.write('  (:goal (and (on a b) (on b c))))\n')
+            for search in ['bfs', 'astar', 'pbfs']:
+                plan = planner.solve('examples/blocksworld/blocksworld.pddl', problem, search=search, heuristic='hmax')
+                expanded = planner.statistics.expanded
+                self.assertEqual(len(planner.solve('examples/blocksworld/blocksworld.pddl', problem, search=search, heuristic='hmax', symmetry=True)), len(plan))
+                self.assertEqual(planner.object_classes, [['d', 'e', 'f']])
+                self.assertLess(planner.statistics.expanded, expanded)
+        finally:
+            shutil.rmtree(directory)
+        self.assertRaises(Exception, planner.solve, 'examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', representation='bitset', symmetry=True)
+
+    def test_object_classes(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/tsp/tsp.pddl')
+        parser.parse_problem('examples/tsp/pb1.pddl')
+        self.assertEqual(object_classes(parser.actions, parser.objects, parser.types, parser.state, parser.positive_goals, parser.negative_goals), [])
+        cities = ['c0', 'c1', 'c2', 'c3']
+        state = frozenset([('at', 'c0')] + [('connected', a, b) for a in cities for b in cities if a != b])
+        goals = frozenset([('visited', city) for city in cities])
+        self.assertEqual(object_classes(parser.actions, {'position': cities}, parser.types, state, goals, frozenset()), [['c1', 'c2', 'c3']])
+        self.assertEqual(object_classes(parser.actions, {'position': cities}, parser.types, state, goals.union([('at', 'c3')]), frozenset()), [['c1', 'c2']])
+        task = SymmetryTask([], state, goals, frozenset(), [['c1', 'c2', 'c3']])
+        first = CanonicalState(state.union([('visited', 'c1')]), task.canonical(state.union([('visited', 'c1')])))
+        second = CanonicalState(state.union([('visited', 'c3')]), task.canonical(state.union([('visited', 'c3')])))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, task.initial_state)
+        self.assertIn(('visited', 'c3'), second)
+
+    def test_solve_stubborn(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/tsp/tsp.pddl', 'examples/tsp/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            for search in ['bfs', 'astar']:
+                length = len(planner.solve(domain, problem, search=search, heuristic='hmax'))
+                expanded = planner.statistics.expanded
+                for representation in ['set', 'bitset', 'sas']:
+                    self.assertEqual(len(planner.solve(domain, problem, representation=representation, search=search, heuristic='hmax', stubborn=True)), length)
+                    self.assertLessEqual(planner.statistics.expanded, expanded)
+        planner.solve('examples/tsp/tsp.pddl', 'examples/tsp/pb1.pddl', stubborn=True)
+        self.assertGreater(planner.stubborn_pruned, 0)
+        self.assertRaises(Exception, planner.solve, 'examples/tsp/tsp.pddl', 'examples/tsp/pb1.pddl', representation='lazy', stubborn=True)
+
+    def test_stubborn_set(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dinner/dinner.pddl')
+        parser.parse_problem('examples/dinner/pb1.pddl')
+        actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+        task = StubbornTask(Task(actions, parser.state, parser.positive_goals, parser.negative_goals), parser.positive_goals, parser.negative_goals)
+        pruned = 0
+        for state in [parser.state] + [new_state for _, new_state in task.task.successors(parser.state)]:
+            applicable = set([i for i, _ in task.task.successors(state)])
+            stubborn = task.stubborn_set(state, applicable)
+            if stubborn is None:
+                continue
+            self.assertTrue(any(stubborn.issuperset(task.achievers[literal]) for literal in task.goal_literals if (literal[0] in state) != literal[1]))
+            for i in stubborn:
+                literal = task.false_literal(task.preconditions[i], state)
+                self.assertTrue(stubborn.issuperset(task.interfering(i) if literal is None else task.achievers.get(literal, ())))
+            pruned += len(applicable.difference(stubborn))
+        self.assertGreater(pruned, 0)
+        self.assertIsNone(task.stubborn_set(parser.positive_goals, set()))
+
+    def test_solve_lazy(self):
+        planner = Planner()
+        for domain, problem in [('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            self.assertEqual(planner.solve(domain, problem, representation='lazy'), planner.solve(domain, problem))
+        self.assertRaises(Exception, planner.solve, 'examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl', representation='lazy', search='astar')
+
+    def test_lazy_task(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/blocksworld/blocksworld.pddl')
+        parser.parse_problem('examples/blocksworld/pb4.pddl')
+        task = LazyTask(parser.actions, parser.state, parser.objects, parser.types, parser.positive_goals, parser.negative_goals)
+        ground_task = Task(ground(parser.actions, parser.state, parser.objects, parser.types, False), parser.state, parser.positive_goals, parser.negative_goals)
+        successors = list(task.successors(task.initial_state))
+        expected = list(ground_task.successors(ground_task.initial_state))
+        self.assertEqual([state for _, state in successors], [state for _, state in expected])
+        self.assertEqual([task.actions[i] for i, _ in successors], [ground_task.actions[i] for i, _ in expected])
+        self.assertEqual(len(task.actions), len(successors))
+
+    def test_solve_parallel(self):
+        planner = Planner()
+        for domain, problem in [('examples/blocksworld/blocksworld.pddl', 'examples/blocksworld/pb4.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+            length = len(planner.solve(domain, problem))
+            for representation in ['set', 'bitset']:
+                plan = planner.solve(domain, problem, representation=representation, search='pbfs', workers=3)
+                self.assertEqual(planner.statistics.peak_closed, planner.statistics.expanded)
+                self.assertEqual(len(plan), length)
+        # Partition keys of string states do not depend on the hash seed of the process
+        command = [sys.executable, '-c', 'from pddl_parser.parallel import partition_key; print(partition_key(frozenset([(\'on\', \'a\', \'b\'), (\'clear\', \'a\')])))']
+        keys = set()
+        for seed in ['1', '2']:
+            environment = dict(os.environ, PYTHONHASHSEED=seed)
+            keys.add(subprocess.check_output(command, env=environment).strip())
+        self.assertEqual(len(keys), 1)
+        actions = [Action('a', [], [['p']], [], [['q']], [['p']]), Action('b', [], [['q']], [], [['p']], [['q']])]
+        self.assertIsNone(planner.search(Task(actions, frozenset([('p',)]), frozenset([('r',)]), frozenset()), 'pbfs', workers=2))
+
+    def test_solve_external(self):
+        planner = Planner()
+        directory = tempfile.mkdtemp()
+        try:
+            for domain, problem in [('examples/blocksworld/blocksworld.pddl', 'examples/blocksworld/pb4.pddl'), ('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl')]:
+                length = len(planner.solve(domain, problem))
+                for representation in ['bitset', 'sas']:
+                    plan = planner.solve(domain, problem, representation=representation, search='ebfs', memory_budget=0.01, external_directory=directory)
+                    self.assertEqual(len(plan), length)
+                    self.assertEqual(os.listdir(directory), [])
+            self.assertRaises(Exception, planner.solve, domain, problem, search='ebfs')
+        finally:
+            shutil.rmtree(directory)
+
+    def test_solve_fingerprints(self):
+        planner = Planner()
+        domain = 'examples/dwr/dwr.pddl'
+        problem = 'examples/dwr/pb1.pddl'
+        plan = planner.solve(domain, problem)
+        self.assertEqual(planner.solve(domain, problem, representation='zobrist'), plan)
+        self.assertEqual(planner.solve(domain, problem, representation='zobrist', fingerprint_bits=64), plan)
+        self.assertLess(planner.statistics.bytes_per_node, 1000)
+        self.assertEqual(len(planner.solve(domain, problem, representation='sas', search='astar', heuristic='hmax', fingerprint_bits=48)), len(plan))
+        self.assertRaises(Exception, planner.solve, domain, problem, fingerprint_bits=65)
+        self.assertEqual(collision_probability(1, 8), 0.0)
+        self.assertEqual(collision_probability(2 ** 16, 8), 1.0)
+        self.assertEqual(collision_probability(2 ** 16, 64), 2 ** 16 * (2 ** 16 - 1) / 2.0 ** 65)
+        key = (1 << 63) | 5
+        self.assertEqual(fingerprint(ZobristState([], key), (1 << 64) - 1), key)
+        self.assertEqual(fingerprint(ZobristState([], key), 0xff), 5)
+        self.assertEqual(fingerprint(frozenset(), None), frozenset())
+
+    def test_zobrist_task(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/blocksworld/blocksworld.pddl')
+        parser.parse_problem('examples/blocksworld/pb4.pddl')
+        actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+        task = ZobristTask(actions, parser.state, parser.positive_goals, parser.negative_goals)
+        states = [task.initial_state]
+        for state in states:
+            key = 0
+            for atom in state:
+                key ^= task.keys[atom]
+            self.assertEqual(state.key, key)
+            self.assertEqual(state, frozenset(state))
+            self.assertEqual(hash(state), hash(frozenset(state)))
+            if len(states) < 50:
+                states += [new_state for _, new_state in task.successors(state)]
+
+    def test_solve_heuristic_search(self):
+        planner = Planner()
+        domain = 'examples/blocksworld/blocksworld.pddl'
+        problem = 'examples/blocksworld/pb4.pddl'
+        optimal = len(planner.solve(domain, problem))
+        for heuristic in ['hmax', 'hadd', 'hff']:
+            self.assertTrue(planner.solve(domain, problem, search='gbfs', heuristic=heuristic))
+            self.assertTrue(planner.solve(domain, problem, search='wastar', heuristic=heuristic, weight=2))
+        self.assertEqual(len(planner.solve(domain, problem, search='astar', heuristic='hmax')), optimal)
+        self.assertRaises(Exception, planner.solve, domain, problem, search='dfs')
+
+    def test_solve_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            planner = Planner()
+            domain = 'examples/dinner/dinner.pddl'
+            problem = 'examples/dinner/pb1.pddl'
+            plan = planner.solve(domain, problem, cache=directory)
+            cache = Cache(directory)
+            parser, ground_actions = cache.load(cache.key([domain, problem], True))
+            self.assertEqual(parser.problem_name, 'pb1')
+            self.assertEqual(len(ground_actions), 4)
+            self.assertEqual(planner.solve(domain, problem, cache=cache), plan)
+            self.assertEqual(cache.load(cache.key([domain, problem], False)), None)
+            # Least recently used entry is evicted first
+            cache.max_size = 0
+            cache.evict()
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_solve_server(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'planner.sock')
+        # Socket left by a stopped server
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        thread = threading.Thread(target=serve, args=(path, 1))
+        thread.start()
+        try:
+            while True:
+                try:
+                    self.assertEqual(client.request({'command': 'ping'}, path), {'status': 'ok'})
+                    break
+                except socket.error:
+                    time.sleep(0.01)
+            self.assertRaises(Exception, serve, path, 1)
+            domain = 'examples/dwr/dwr.pddl'
+            problem = 'examples/dwr/pb1.pddl'
+            plan = [[act.name] + list(act.parameters) for act in Planner().solve(domain, problem, search='astar', heuristic='hmax')]
+            first = client.solve(domain, problem, path, search='astar', heuristic='hmax')
+            second = client.solve(domain, problem, path, search='astar', heuristic='hmax')
+            self.assertEqual((first['status'], first['cached'], first['plan']), ('solved', False, plan))
+            self.assertEqual((second['status'], second['cached'], second['plan']), ('solved', True, plan))
+            self.assertEqual(client.solve(domain, 'examples/dwr/pb2.pddl', path)['plan'], [])
+            self.assertTrue(client.solve(domain, problem, path, search='unknown')['status'].startswith('error'))
+            self.assertEqual(client.request([], path)['status'], 'error: invalid request')
+        finally:
+            client.request({'command': 'shutdown'}, path)
+            thread.join()
+            shutil.rmtree(directory)
+
+    def test_memory_cache(self):
+        cache = MemoryCache(2)
+        for key in 'abc':
+            cache.store(key, key.upper())
+            cache.load('a')
+        self.assertEqual(list(cache.entries), ['c', 'a'])
+        self.assertIsNone(cache.load('b'))
+        self.assertEqual(cache.key(['examples/dinner/dinner.pddl']), Cache(tempfile.gettempdir()).key(['examples/dinner/dinner.pddl']))
+        # Ground task stored under the given key, files are not hashed again
+        cache = MemoryCache()
+        plan = Planner().solve('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl', cache=cache, cache_key='request')
+        self.assertEqual(list(cache.entries), ['request'])
+        self.assertEqual(Planner().solve('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl', cache=cache, cache_key='request'), plan)
+
+    def test_solve_portfolio(self):
+        planner = Planner()
+        domain = 'examples/blocksworld/blocksworld.pddl'
+        problem = 'examples/blocksworld/pb6.pddl'
+        plan = planner.solve_portfolio(domain, problem, [{'search': 'gbfs'}, {'search': 'astar', 'heuristic': 'hmax'}])
+        self.assertEqual([entry['status'] for entry in planner.portfolio], ['solved', 'cancelled'])
+        self.assertEqual(len(plan), planner.portfolio[0]['length'])
+        configs = [{'search': 'gbfs'}, {'search': 'bfs'}, {'search': 'unknown'}]
+        plan = planner.solve_portfolio(domain, problem, configs, 60, True)
+        self.assertEqual(len(plan), len(planner.solve(domain, problem)))
+        self.assertEqual([entry['status'][:5] for entry in planner.portfolio], ['solve', 'solve', 'error'])
+        self.assertIsNone(planner.solve_portfolio(domain, problem, [{'search': 'bfs'}], 0.01))
+        self.assertEqual(planner.portfolio[0]['status'], 'cancelled')
+
+    def test_solve_batch(self):
+        planner = Planner()
+        domain = 'examples/blocksworld/blocksworld.pddl'
+        problems = problem_files(domain, 'examples/blocksworld')
+        self.assertEqual(len(problems), 6)
+        results = list(solve_batch(domain, problems[:4], 2, time_limit=60))
+        self.assertEqual(sorted(r[0] for r in results), problems[:4])
+        for problem, plan, status, _ in results:
+            self.assertEqual(status, 'solved')
+            self.assertEqual(plan, planner.solve(domain, problem))
+        results = list(solve_batch('examples/dwr/dwr.pddl', ['examples/dwr/pb1.pddl'], 1, time_limit=0.01))
+        self.assertEqual(results[0][1:3], (None, 'timeout'))
+
+    def test_solve_statistics(self):
+        events = []
+        statistics = Statistics([lambda event, stats: events.append(event)], interval=1000)
+        planner = Planner()
+        plan = planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', statistics=statistics)
+        self.assertIs(planner.statistics, statistics)
+        self.assertEqual(events[:4], ['tokenize', 'parse', 'ground', 'progress'])
+        self.assertEqual(events[-1], 'search')
+        self.assertEqual(statistics.ground_actions, 314)
+        self.assertEqual(len(plan), 17)
+        self.assertTrue(statistics.expanded > 1000)
+        self.assertEqual(statistics.generated, statistics.duplicates + statistics.peak_closed)
+        self.assertTrue(statistics.peak_open > 0)
+        self.assertTrue(statistics.nodes_per_second() > 0)
+        self.assertTrue(statistics.bytes_per_node > 0)
+        planner.solve('examples/dinner/dinner.pddl', 'examples/dinner/pb1.pddl')
+        self.assertEqual(planner.statistics.expanded, 6)
+
+    #-----------------------------------------------
+    # Test node store
+    #-----------------------------------------------
+
+    def test_node_store(self):
+        store = NodeStore()
+        root = store.add('s0')
+        a = store.add('s1', root, 3)
+        b = store.add('s2', root, 5)
+        c = store.add('s3', b, 7)
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store.plan(root), [])
+        self.assertEqual(store.plan(a), [3])
+        self.assertEqual(store.plan(c), [5, 7])
+        self.assertTrue(store.memory() > 0)
+
+    #-----------------------------------------------
+    # Test heuristics
+    #-----------------------------------------------
+
+    def test_heuristics(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dinner/dinner.pddl')
+        parser.parse_problem('examples/dinner/pb1.pddl')
+        task = Task(parser.actions, parser.state, parser.positive_goals, parser.negative_goals)
+        self.assertEqual(HMax(task)(task.initial_state), 1)
+        self.assertEqual(HAdd(task)(task.initial_state), 2)
+        self.assertEqual(HFF(task)(task.initial_state), 2)
+        self.assertEqual(HFF(task)(frozenset()), float('inf'))
+
+    #-----------------------------------------------
+    # Test atom table
+    #-----------------------------------------------
+
+    def test_atom_table(self):
+        table = AtomTable()
+        state = frozenset([('on', 'a', 'b'), ('clear', 'a'), ('ontable', 'b')])
+        action = Action('unstack', [], [['on', 'a', 'b'], ['clear', 'a']], [['holding', 'a']], [['holding', 'a'], ['clear', 'b']], [['on', 'a', 'b'], ['clear', 'a']])
+        bits = table.encode(state)
+        positive, negative, add, delete = action.encode(table)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(bits & positive, positive)
+        self.assertFalse(bits & negative)
+        self.assertEqual(table.decode((bits & ~delete) | add), state.difference(action.del_effects).union(action.add_effects))
+
+    #-----------------------------------------------
+    # Test grounding
+    #-----------------------------------------------
+
+    def test_static_predicates(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        self.assertEqual(static_predicates(parser.actions), set(['adjacent', 'attached', 'belong', 'equal']))
+
+    def test_ground_reachable(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        full = ground(parser.actions, parser.state, parser.objects, parser.types, False)
+        reachable = ground(parser.actions, parser.state, parser.objects, parser.types)
+        self.assertEqual(len(full), 1628)
+        self.assertEqual(len(reachable), 314)
+        self.assertEqual([act for act in full if act in reachable], reachable)
+        planner = Planner()
+        for act in full:
+            if planner.applicable(parser.state, act.positive_preconditions, act.negative_preconditions):
+                self.assertIn(act, reachable)
+
+    def test_ground_parallel(self):
+        type_map = [['a', 'b', 'c'], ['d'], ['e', 'f']]
+        product = list(itertools.product(*type_map))
+        for start in range(len(product)):
+            self.assertEqual(list(assignments(type_map, start, 4)), product[start:start + 4])
+        self.assertEqual(list(assignments([], 0, 1)), [()])
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        ground_actions = ground(parser.actions, parser.state, parser.objects, parser.types, False)
+        self.assertEqual(ground_parallel(parser.actions, parser.objects, parser.types, 2, 7), ground_actions)
+        compact_actions = ground_parallel(parser.actions, parser.objects, parser.types, 2, 7, True)
+        self.assertEqual([str(act) for act in compact_actions], [str(act) for act in compact(ground_actions)])
+        self.assertTrue(all(type(act) is GroundAction and type(act.add_effects) is tuple for act in compact_actions))
+        self.assertRaises(Exception, Planner().solve, 'examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', ground_workers=2)
+        self.assertTrue(Planner().solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', reachable=False, ground_workers=2, compact=True))
+
+    def test_action_template(self):
+        action = Action('put', [['?k', 'crane'], ['?c', 'container'], ['?p', 'pile']],
+                        [['holding', '?k', '?c'], ['top', 'pallet', '?p'], ['ready']], [['equal', '?c', 'pallet']],
+                        [['in', '?c', '?p'], ['top', '?c', '?p']], [['holding', '?k', '?c'], ['top', 'pallet', '?p']])
+        variables = ['?k', '?c', '?p']
+        assignment = ('k1', 'ca', 'p1')
+        self.assertEqual(ActionTemplate(action).instantiate(assignment),
+            Action('put', assignment,
+                   action.replace(action.positive_preconditions, variables, assignment),
+                   action.replace(action.negative_preconditions, variables, assignment),
+                   action.replace(action.add_effects, variables, assignment),
+                   action.replace(action.del_effects, variables, assignment)))
+
+    def test_compact(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        ground_actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+        compact_actions = compact(ground_actions)
+        atoms = {}
+        for act, compact_act in zip(ground_actions, compact_actions):
+            self.assertEqual((compact_act.name, compact_act.parameters), (act.name, act.parameters))
+            for group in ['positive_preconditions', 'negative_preconditions', 'add_effects', 'del_effects']:
+                self.assertIs(type(getattr(compact_act, group)), tuple)
+                self.assertEqual(frozenset(getattr(compact_act, group)), getattr(act, group))
+                for atom in getattr(compact_act, group):
+                    self.assertIs(atoms.setdefault(atom, atom), atom)
+            self.assertEqual(str(compact_act), str(act))
+        self.assertNotEqual(compact_actions[0], compact(ground_actions[:1])[0])
+        self.assertEqual(len(set(compact_actions)), len(compact_actions))
+
+    #-----------------------------------------------
+    # Test simplify
+    #-----------------------------------------------
+
+    def test_simplify(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        ground_actions = ground(parser.actions, parser.state, parser.objects, parser.types, False)
+        actions, origin, state, goal_pos, goal_not = simplify(ground_actions, parser.state, parser.positive_goals, parser.negative_goals)
+        self.assertEqual(len(actions), 314)
+        self.assertEqual(len(state), 21)
+        self.assertNotIn(('adjacent', 'l1', 'l2'), state)
+        self.assertEqual(goal_pos, parser.positive_goals)
+        for act, i in zip(actions, origin):
+            self.assertEqual(act.name, ground_actions[i].name)
+            self.assertEqual(act.parameters, ground_actions[i].parameters)
+            self.assertEqual(act.add_effects, ground_actions[i].add_effects)
+            self.assertTrue(act.positive_preconditions.issubset(ground_actions[i].positive_preconditions))
+            self.assertFalse(any(pre[0] in ('adjacent', 'attached', 'belong', 'equal') for pre in act.positive_preconditions | act.negative_preconditions))
+        self.assertEqual(simplify(ground_actions, parser.state, frozenset([('adjacent', 'l1', 'l1')]), frozenset()), None)
+        self.assertEqual(simplify(ground_actions, parser.state, frozenset(), frozenset([('adjacent', 'l1', 'l2')])), None)
+        planner = Planner()
+        self.assertEqual(planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl'), planner.solve('examples/dwr/dwr.pddl', 'examples/dwr/pb1.pddl', simplify=False))
+
+    #-----------------------------------------------
+    # Test SAS
+    #-----------------------------------------------
+
+    def test_sas_task(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/tsp/tsp.pddl')
+        parser.parse_problem('examples/tsp/pb1.pddl')
+        actions = ground(parser.actions, parser.state, parser.objects, parser.types)
+        self.assertEqual(synthesize_invariants(actions, parser.state), [frozenset([('at', None)])])
+        groups = mutex_groups(actions, synthesize_invariants(actions, parser.state))
+        self.assertEqual(groups, [[('at', 'albany'), ('at', 'boston'), ('at', 'newyork'), ('at', 'pittsburgh'), ('at', 'toronto')]])
+        task = SASTask(actions, parser.state, parser.positive_goals, parser.negative_goals)
+        self.assertEqual(len(task.variables), 6)
+        self.assertIsInstance(task.initial_state, bytes)
+        self.assertEqual(task.decode(task.initial_state), parser.state)
+        for i, state in task.successors(task.initial_state):
+            act = actions[i]
+            self.assertEqual(task.decode(state), parser.state.difference(act.del_effects).union(act.add_effects))
+
+    def test_sas_static_atoms(self):
+        # Static atom of a fluent predicate is not grouped with fluent atoms
+        directory = tempfile.mkdtemp()
+        try:
+            domain = os.path.join(directory, 'domain.pddl')
+            problem = os.path.join(directory, 'problem.pddl')
+            with open(domain, 'w') as f:
+                f.write('(define (domain static) (:requirements :strips) (:predicates (p ?x) (q)) (:action make-b :parameters () :precondition (q) :effect (and (p b) (not (q)))))')
+            with open(problem, 'w') as f:
+                f.write('(define (problem static-1) (:domain static) (:objects a b) (:init (p a) (q)) (:goal (and (p a) (p b))))')
+            planner = Planner()
+            plan = planner.solve(domain, problem, representation='sas', simplify=False)
+            self.assertEqual([act.name for act in plan], ['make-b'])
+            self.assertEqual(planner.solve(domain, problem, simplify=False)[0].name, 'make-b')
+        finally:
+            shutil.rmtree(directory)
+
+    #-----------------------------------------------
+    # Test successor generator
+    #-----------------------------------------------
+
+    def test_successor_generator(self):
+        parser = PDDL_Parser()
+        parser.parse_domain('examples/dwr/dwr.pddl')
+        parser.parse_problem('examples/dwr/pb1.pddl')
+        ground_actions = []
+        for action in parser.actions:
+            ground_actions += action.groundify(parser.objects, parser.types)
+        generator = SuccessorGenerator(ground_actions)
+        planner = Planner()
+        state = parser.state
+        for _ in range(4):
+            expected = [i for i, act in enumerate(ground_actions) if planner.applicable(state, act.positive_preconditions, act.negative_preconditions)]
+            self.assertEqual(generator.applicable(state), expected)
+            act = ground_actions[expected[-1]]
+            state = planner.apply(state, act.add_effects, act.del_effects)
+
 
 # -----------------------------------------------
 # Main